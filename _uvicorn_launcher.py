@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Shared uvicorn command-line construction for the launcher scripts."""
+
+import os
+import sys
+from functools import lru_cache
+
+
+def worker_count():
+    """Number of uvicorn workers to run, from SYSTEM_API_WORKERS.
+    
+    Defaults to one: api.server keeps in-process state (agent pause/stop
+    events, custom templates) that separate worker processes would not
+    share. More workers are an explicit opt-in, either a number or "auto"
+    for one per CPU this process may use. The affinity mask reflects
+    container and taskset limits, which os.cpu_count() ignores; it is
+    unavailable on Windows and macOS.
+    """
+    value = os.environ.get('SYSTEM_API_WORKERS', '').strip().lower()
+    if value == 'auto':
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except AttributeError:
+            return os.cpu_count() or 1
+    try:
+        return max(1, int(value or 1))
+    except ValueError:
+        return 1
+
+
+@lru_cache(maxsize=8)
+def build_cmd(app_import, port, workers=None, reload=False, host="0.0.0.0"):
+    """Build the argv that runs an app under uvicorn.
+    
+    Development runs use --reload, which forces a single worker; otherwise
+    the app runs without an access log, and with --workers only when more
+    than one worker is asked for. Returned as a tuple so the cached value
+    can't be modified by callers.
+    """
+    cmd = (
+        sys.executable, '-m', 'uvicorn',
+        app_import,
+        '--host', host,
+        '--port', str(port)
+    )
+    if reload:
+        return cmd + ('--reload',)
+    if workers and workers > 1:
+        return cmd + ('--workers', str(workers), '--no-access-log')
+    return cmd + ('--no-access-log',)
+
+
+def child_env():
+    """Environment for uvicorn children: unbuffered output, bytecode caching on.
+    
+    PYTHONDONTWRITEBYTECODE disables .pyc writing when set to any non-empty
+    value (even "0"), so it is removed rather than overridden.
+    """
+    env = os.environ.copy()
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONUNBUFFERED'] = '1'
+    return env
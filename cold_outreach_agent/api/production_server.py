@@ -11,7 +11,7 @@ from uuid import uuid4, UUID
 from fastapi import FastAPI, HTTPException, Depends, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.exception_handlers import http_exception_handler
 from pydantic import BaseModel, Field, ValidationError
 import uvicorn
@@ -1452,22 +1452,48 @@ async def update_user_role(user_id: str, data: RoleUpdate, request_id: str = Dep
 
 # --- SYNC & IMPORT/EXPORT ENDPOINTS ---
 
+# Columns of the leads CSV export: header -> stored lead field
+LEAD_EXPORT_COLUMNS = {
+    "lead_id": "id",
+    "business_name": "business_name",
+    "email": "email",
+    "category": "category",
+    "location": "location",
+    "review_status": "review_status",
+    "outreach_status": "lifecycle_state",
+}
+
+
+async def _stream_export(first_chunk: str, chunks):
+    """Yield an export whose first chunk was already read, logging later failures."""
+    yield first_chunk
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except Exception as e:
+        # The response has started, so this can no longer become a 500; log
+        # it and re-raise so the transfer is aborted rather than ended cleanly
+        if logging_service:
+            logging_service.log_error(e, component="api", operation="export_leads_csv")
+        raise
+
+
 @app.get("/api/export/csv")
 async def export_leads_csv(request_id: str = Depends(get_request_id)):
     """Export leads to CSV."""
     try:
-        if db_service:
-            all_leads = await db_service.get_leads(pagination=PaginationParams(page=1, page_size=10000))
-            csv_lines = ["lead_id,business_name,email,category,location,review_status,outreach_status"]
-            for lead in all_leads.items:
-                csv_lines.append(f"{lead.id},{lead.business_name},{lead.email or ''},{lead.category or ''},{lead.location or ''},{lead.review_status},{lead.lifecycle_state}")
-            
-            return Response(
-                content="\n".join(csv_lines),
+        if sync_service:
+            # Streamed chunk by chunk from the database, so the whole table is
+            # never held in memory. The first chunk (header and first page) is
+            # read up front so a database failure still becomes a 500.
+            chunks = sync_service.export_leads_csv(columns=LEAD_EXPORT_COLUMNS)
+            first_chunk = await chunks.__anext__()
+            return StreamingResponse(
+                _stream_export(first_chunk, chunks),
                 media_type="text/csv",
                 headers={"Content-Disposition": "attachment; filename=leads_export.csv"}
             )
-        return Response(content="lead_id,business_name,email,category,location,review_status,outreach_status", media_type="text/csv")
+        return Response(content=",".join(LEAD_EXPORT_COLUMNS) + "\r\n", media_type="text/csv")
     except Exception as e:
         raise HTTPException(500, str(e))
 
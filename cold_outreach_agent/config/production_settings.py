@@ -1,6 +1,7 @@
 """Production-grade configuration management with validation and environment support."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
@@ -227,6 +228,7 @@ class SystemConfig:
     # Performance
     max_concurrent_tasks: int = 10
     task_timeout_seconds: int = 300
+    api_workers: int = 0  # 0 = automatic (one worker while the database is SQLite)
     
     # Health checks
     health_check_interval: int = 60  # seconds
@@ -247,6 +249,9 @@ class SystemConfig:
         if self.max_concurrent_tasks <= 0:
             errors.append("max_concurrent_tasks must be positive")
         
+        if self.api_workers < 0:
+            errors.append("api_workers must be 0 (automatic) or positive")
+        
         return errors
 
 
@@ -375,6 +380,7 @@ class ProductionSettings:
             
             max_concurrent_tasks=self._get_int("SYSTEM_MAX_CONCURRENT_TASKS", 10),
             task_timeout_seconds=self._get_int("SYSTEM_TASK_TIMEOUT_SECONDS", 300),
+            api_workers=self._get_int("SYSTEM_API_WORKERS", 0),
             
             health_check_interval=self._get_int("SYSTEM_HEALTH_CHECK_INTERVAL", 60),
             enable_metrics=self._get_bool("SYSTEM_ENABLE_METRICS", True),
@@ -493,5 +499,11 @@ class ProductionSettings:
         }
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> ProductionSettings:
+    """Get the shared settings, reading the environment only on first use."""
+    return ProductionSettings()
+
+
 # Global settings instance
-settings = ProductionSettings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -35,8 +35,8 @@ from .crm import (
 
 # User and role models
 from .users import (
-    User, UserRole, Permission, ROLE_PERMISSIONS,
-    LeadAssignment, ApprovalDelegation, UserActivityLog, UserSession,
+    User, UserRole, Permission, ROLE_PERMISSIONS, PERMISSION_BITS, ROLE_BITMASKS,
+    role_has_permission, LeadAssignment, ApprovalDelegation, UserActivityLog, UserSession,
     UserCreate, UserUpdate, AssignLeadRequest, DelegateApprovalRequest
 )
 
@@ -99,7 +99,8 @@ __all__ = [
     "ReplyClassifyRequest", "OpportunityCreate", "OpportunityUpdate", "NoteCreate",
     
     # Users
-    "User", "UserRole", "Permission", "ROLE_PERMISSIONS",
+    "User", "UserRole", "Permission", "ROLE_PERMISSIONS", "PERMISSION_BITS", "ROLE_BITMASKS",
+    "role_has_permission",
     "LeadAssignment", "ApprovalDelegation", "UserActivityLog", "UserSession",
     "UserCreate", "UserUpdate", "AssignLeadRequest", "DelegateApprovalRequest",
     
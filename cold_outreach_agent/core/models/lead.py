@@ -114,7 +114,7 @@ class Lead(BaseModel):
     def is_ready_for_outreach(self) -> bool:
         """Check if lead is ready for email outreach."""
         return (
-            self.lifecycle_state == LeadState.APPROVED and
+            self.lifecycle_state in (LeadState.APPROVED, LeadState.READY_FOR_OUTREACH) and
             self.review_status == ReviewStatus.APPROVED and
             self.email is not None and
             self.email != ""
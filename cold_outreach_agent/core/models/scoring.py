@@ -3,6 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
 
@@ -61,8 +62,9 @@ class ScoreComponent(BaseModel):
         )
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def _score_to_level(score: Decimal) -> ScoreLevel:
-        """Convert numeric score to level."""
+        """Convert numeric score to level (memoized; scores are low-cardinality)."""
         if score >= Decimal("0.8"):
             return ScoreLevel.EXCELLENT
         elif score >= Decimal("0.6"):
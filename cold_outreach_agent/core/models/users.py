@@ -3,6 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
 
@@ -81,6 +82,21 @@ ROLE_PERMISSIONS: Dict[UserRole, List[Permission]] = {
     ]
 }
 
+# One bit per permission, and each role's permissions folded into a bitmask
+PERMISSION_BITS: Dict[Permission, int] = {
+    permission: 1 << index for index, permission in enumerate(Permission)
+}
+ROLE_BITMASKS: Dict[UserRole, int] = {
+    role: sum(PERMISSION_BITS[permission] for permission in set(permissions))
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+
+@lru_cache(maxsize=1024)
+def role_has_permission(role: UserRole, permission: Permission) -> bool:
+    """Check whether a role grants a permission, using the role bitmask."""
+    return bool(ROLE_BITMASKS.get(role, 0) & PERMISSION_BITS.get(permission, 0))
+
 
 class User(BaseModel):
     """User account model."""
@@ -122,8 +138,7 @@ class User(BaseModel):
         if permission in self.custom_permissions:
             return True
         # Role-based permissions
-        role_permissions = ROLE_PERMISSIONS.get(self.role, [])
-        return permission in role_permissions
+        return role_has_permission(self.role, permission)
     
     def get_all_permissions(self) -> List[Permission]:
         """Get all permissions for this user."""
@@ -298,6 +313,7 @@ class UserCreate(BaseModel):
 
 class UserUpdate(BaseModel):
     """Update user request."""
+    email: Optional[str] = Field(None, max_length=255)
     display_name: Optional[str] = Field(None, min_length=1, max_length=100)
     role: Optional[UserRole] = None
     custom_permissions: Optional[List[Permission]] = None
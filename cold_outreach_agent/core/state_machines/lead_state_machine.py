@@ -1,7 +1,7 @@
 """Lead lifecycle state machine with proper validation and transitions."""
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
 from ..models.lead import Lead, LeadState, ReviewStatus
@@ -108,6 +108,110 @@ class LeadStateMachine:
                 error_code="TRANSITION_ERROR"
             )
     
+    async def transition_state_sequence(
+        self,
+        lead_id: UUID,
+        target_states: List[LeadState],
+        actor: str,
+        reason: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> OperationResult[Lead]:
+        """
+        Move a lead through several states with a single lead update.
+        
+        Every hop is validated up front, and the lead update commits in one
+        transaction with a state transition record per hop, so either the
+        whole chain is applied or none of it is. Each hop's audit log entry
+        is written after that commit.
+        
+        Args:
+            lead_id: Lead identifier
+            target_states: States to pass through, in order
+            actor: Who is performing the transitions
+            reason: Optional reason for the transitions
+            metadata: Additional metadata for the transitions
+            
+        Returns:
+            OperationResult with updated lead or error
+        """
+        try:
+            # Get current lead
+            lead = await self.db.get_lead_by_id(lead_id)
+            if not lead:
+                return OperationResult.error_result(
+                    error=f"Lead {lead_id} not found",
+                    error_code="LEAD_NOT_FOUND"
+                )
+            
+            if not target_states:
+                return OperationResult.success_result(data=lead)
+            
+            original_state = lead.lifecycle_state
+            
+            # Validate the whole chain against the lead as it would be at each hop
+            hops = []
+            new_values: Dict[str, Any] = {}
+            current = lead
+            for target_state in target_states:
+                if not self._is_valid_transition(current.lifecycle_state, target_state):
+                    return OperationResult.error_result(
+                        error=f"Invalid transition from {current.lifecycle_state} to {target_state}",
+                        error_code="INVALID_TRANSITION"
+                    )
+                
+                validation_result = await self._validate_transition(current, target_state, metadata)
+                if not validation_result.success:
+                    return validation_result
+                
+                hops.append((current.lifecycle_state, target_state))
+                side_effects = await self._apply_side_effects(current, target_state, metadata)
+                side_effects.pop("version", None)  # bumped once by the update below
+                new_values.update(side_effects)
+                current = current.model_copy(update={"lifecycle_state": target_state, **side_effects})
+            
+            new_values["lifecycle_state"] = target_states[-1]
+            
+            # Apply the final state in one update, recording every hop in the
+            # same transaction
+            updated_lead = await self.db.update_lead_state(lead_id, new_values, transitions=[
+                StateTransition(
+                    entity_id=lead_id,
+                    entity_type=EntityType.LEAD,
+                    from_state=from_state,
+                    to_state=to_state,
+                    actor=actor,
+                    reason=reason,
+                    metadata=metadata or {}
+                )
+                for from_state, to_state in hops
+            ])
+            
+            # Log every hop for the audit trail
+            for from_state, to_state in hops:
+                await self.audit.log_action(
+                    entity_type=EntityType.LEAD,
+                    entity_id=lead_id,
+                    action="state_transition",
+                    actor=actor,
+                    old_values={"lifecycle_state": from_state},
+                    new_values={"lifecycle_state": to_state},
+                    metadata={
+                        "reason": reason,
+                        "transition_metadata": metadata
+                    }
+                )
+            
+            return OperationResult.success_result(
+                data=updated_lead,
+                metadata={"transition": " -> ".join([original_state, *target_states])}
+            )
+            
+        except Exception as e:
+            return OperationResult.error_result(
+                error=f"State transition failed: {str(e)}",
+                error_code="TRANSITION_ERROR"
+            )
+    
     def _is_valid_transition(self, current_state: LeadState, target_state: LeadState) -> bool:
         """Check if state transition is valid."""
         valid_transitions = {
@@ -273,13 +377,30 @@ class LeadStateMachine:
         analysis_results: Dict[str, Any],
         actor: str = "system"
     ) -> OperationResult[Lead]:
-        """Mark lead analysis as complete."""
+        """Mark lead analysis as complete.
+        
+        A lead still in DISCOVERED (analysis ran without its start being
+        recorded) passes through ANALYZING, with both hops recorded.
+        """
+        reason = "Website analysis completed"
+        metadata = {"analysis_results": analysis_results}
+        
+        lead = await self.db.get_lead_by_id(lead_id)
+        if lead and lead.lifecycle_state == LeadState.DISCOVERED:
+            return await self.transition_state_sequence(
+                lead_id=lead_id,
+                target_states=[LeadState.ANALYZING, LeadState.ANALYZED],
+                actor=actor,
+                reason=reason,
+                metadata=metadata
+            )
+        
         return await self.transition_state(
             lead_id=lead_id,
             target_state=LeadState.ANALYZED,
             actor=actor,
-            reason="Website analysis completed",
-            metadata={"analysis_results": analysis_results}
+            reason=reason,
+            metadata=metadata
         )
     
     async def mark_failed(
@@ -31,9 +31,7 @@ class DesktopPackager:
             errors.append("PyInstaller is not installed or not in PATH")
             
         # Check frontend build
-        frontend_dist = self.project_root / "Frontend" / "dist"
-        if not frontend_dist.exists():
-            warnings.append("Frontend build directory not found. Building without frontend assets?")
+        warnings.extend(self.check_frontend_build())
             
         return {
             "valid": len(errors) == 0,
@@ -41,6 +39,13 @@ class DesktopPackager:
             "warnings": warnings
         }
         
+    def check_frontend_build(self) -> List[str]:
+        """Warnings about the frontend build; non-fatal, so checked on every run."""
+        frontend_dist = self.project_root / "Frontend" / "dist"
+        if not frontend_dist.exists():
+            return ["Frontend build directory not found. Building without frontend assets?"]
+        return []
+        
     def package_application(
         self,
         app_name: str = "ColdOutreachAgent",
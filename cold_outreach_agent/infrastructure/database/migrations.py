@@ -29,8 +29,13 @@ class MigrationManager:
     
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        self._is_uri = str(db_path).startswith("file:")
         self.migrations = self._get_migrations()
     
+    def _connect(self):
+        """Open a connection to the database being migrated."""
+        return aiosqlite.connect(self.db_path, uri=self._is_uri)
+    
     def _get_migrations(self) -> List[Migration]:
         """Define all database migrations."""
         return [
@@ -487,9 +492,10 @@ Best regards,
         """Run all pending migrations."""
         try:
             # Ensure database file exists
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._is_uri:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 # Create migration tracking table if it doesn't exist
                 await db.execute("""
                     CREATE TABLE IF NOT EXISTS schema_migrations (
@@ -547,7 +553,7 @@ Best regards,
     async def rollback(self, target_version: int):
         """Rollback to a specific version."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 current_version = await self._get_current_version(db)
                 
                 if target_version >= current_version:
@@ -594,7 +600,7 @@ Best regards,
     async def get_migration_status(self) -> Dict[str, Any]:
         """Get current migration status."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 current_version = await self._get_current_version(db)
                 
                 # Get applied migrations
@@ -605,12 +611,10 @@ Best regards,
                 """)
                 applied_migrations = await cursor.fetchall()
                 
-                # Get pending migrations
-                pending_migrations = [
-                    {"version": m.version, "name": m.name}
-                    for m in self.migrations 
-                    if m.version > current_version
-                ]
+                # Count pending migrations (they are every version above the current one)
+                pending_migrations = sum(
+                    1 for m in self.migrations if m.version > current_version
+                )
                 
                 return {
                     "current_version": current_version,
@@ -629,7 +633,7 @@ Best regards,
     async def validate_schema(self) -> Dict[str, Any]:
         """Validate current database schema."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 # Check if all expected tables exist
                 cursor = await db.execute("""
                     SELECT name FROM sqlite_master 
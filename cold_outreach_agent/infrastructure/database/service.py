@@ -5,7 +5,7 @@ import sqlite3
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Union, AsyncIterator
 from uuid import UUID, uuid4
 
 import aiosqlite
@@ -14,23 +14,46 @@ from ...core.models.lead import Lead, LeadCreate, LeadUpdate, LeadFilter, LeadSt
 from ...core.models.email import EmailCampaign, EmailCampaignCreate, EmailCampaignUpdate, EmailFilter, EmailState
 from ...core.models.campaign import EmailSequence, LeadSequenceEnrollment, SequenceStatus, LeadSequenceStatus
 from ...core.models.common import AuditLog, StateTransition, PaginationParams, PaginatedResponse
-from ...core.exceptions import DatabaseError, LeadNotFoundError, EmailCampaignNotFoundError
+from ...core.exceptions import DatabaseError, DuplicateLeadError, LeadNotFoundError, EmailCampaignNotFoundError
 from .migrations import MigrationManager
 
 
 class ProductionDatabaseService:
     """Production-grade database service with proper error handling and transactions."""
     
-    def __init__(self, db_path: Path):
+    _LEAD_INSERT_SQL = """
+        INSERT INTO leads (
+            id, business_name, category, location, maps_url, website_url,
+            email, phone, discovery_source, discovery_confidence,
+            discovery_metadata, discovered_at, lifecycle_state, review_status,
+            tag, quality_score, created_at, updated_at, version, notes, metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def __init__(self, db_path: Path, pragmas: Sequence[str] = ()):
         self.db_path = db_path
+        # PRAGMA statements run on every new connection (e.g. tuning for tests)
+        self._pragmas = tuple(pragmas)
+        # Paths starting with "file:" are SQLite URIs, e.g. a shared-cache
+        # in-memory database that several connections can see at once
+        self._is_uri = str(db_path).startswith("file:")
         self.migration_manager = MigrationManager(db_path)
         self._connection_pool = None
     
+    @asynccontextmanager
+    async def _connect(self):
+        """Open a connection to the configured database."""
+        async with aiosqlite.connect(self.db_path, uri=self._is_uri) as db:
+            for pragma in self._pragmas:
+                await db.execute(pragma)
+            yield db
+    
     async def initialize(self):
         """Initialize database with migrations and indexes."""
         try:
             # Ensure database directory exists
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._is_uri:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Run migrations
             await self.migration_manager.migrate()
@@ -71,17 +94,23 @@ class ProductionDatabaseService:
             "CREATE INDEX IF NOT EXISTS idx_state_transitions_created_at ON state_transitions(created_at)"
         ]
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             for index_sql in indexes:
                 await db.execute(index_sql)
             await db.commit()
     
     @asynccontextmanager
-    async def transaction(self):
-        """Async context manager for database transactions."""
-        async with aiosqlite.connect(self.db_path) as db:
+    async def transaction(self, immediate: bool = False):
+        """Async context manager for database transactions.
+        
+        immediate=True takes the write lock up front (BEGIN IMMEDIATE), for
+        transactions that read before they write: a deferred transaction
+        that has to upgrade its lock fails at once with "database is locked"
+        when another writer got in first, instead of waiting busy_timeout.
+        """
+        async with self._connect() as db:
             try:
-                await db.execute("BEGIN")
+                await db.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
                 yield db
                 await db.commit()
             except Exception:
@@ -99,72 +128,130 @@ class ProductionDatabaseService:
                 updated_at=datetime.now()
             )
             
-            async with self.transaction() as db:
+            async with self.transaction(immediate=True) as db:
                 # Check for duplicates
                 if await self._lead_exists_by_business_location(
                     db, lead.business_name, lead.location
                 ):
-                    raise DatabaseError(
-                        f"Lead already exists: {lead.business_name} in {lead.location}",
-                        error_code="DUPLICATE_LEAD"
-                    )
+                    raise DuplicateLeadError(lead.business_name, lead.location)
                 
                 # Insert lead
-                await db.execute("""
-                    INSERT INTO leads (
-                        id, business_name, category, location, maps_url, website_url,
-                        email, phone, discovery_source, discovery_confidence,
-                        discovery_metadata, discovered_at, lifecycle_state, review_status,
-                        tag, quality_score, created_at, updated_at, version, notes, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    str(lead.id), lead.business_name, lead.category, lead.location,
-                    lead.maps_url, lead.website_url, lead.email, lead.phone,
-                    lead.discovery_source, float(lead.discovery_confidence) if lead.discovery_confidence else None,
-                    json.dumps(lead.discovery_metadata), lead.discovered_at.isoformat(),
-                    lead.lifecycle_state, lead.review_status, lead.tag,
-                    float(lead.quality_score) if lead.quality_score else None,
-                    lead.created_at.isoformat(), lead.updated_at.isoformat(),
-                    lead.version, lead.notes, json.dumps(lead.metadata)
-                ))
+                await db.execute(self._LEAD_INSERT_SQL, self._lead_insert_params(lead))
             
             return lead
             
+        except sqlite3.IntegrityError as e:
+            # A unique column (e.g. maps_url) already holds this lead
+            if "UNIQUE" not in str(e):
+                raise DatabaseError(f"Failed to create lead: {str(e)}")
+            raise DuplicateLeadError(
+                lead_data.business_name, lead_data.location, context={"constraint": str(e)}
+            ) from None
         except Exception as e:
             if isinstance(e, DatabaseError):
                 raise
             raise DatabaseError(f"Failed to create lead: {str(e)}")
     
-    async def get_lead_by_id(self, lead_id: UUID) -> Optional[Lead]:
-        """Get lead by ID."""
+    async def create_leads_bulk(self, leads_data: List[LeadCreate]) -> List[Lead]:
+        """Create many leads in one transaction with a single executemany insert."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
+            now = datetime.now()
+            leads = [
+                Lead(id=uuid4(), **lead_data.dict(), created_at=now, updated_at=now)
+                for lead_data in leads_data
+            ]
+            
+            async with self.transaction(immediate=True) as db:
+                # Check for duplicates, both in the database and within the batch
+                seen = set()
+                for lead in leads:
+                    key = (lead.business_name.lower(), lead.location.lower())
+                    if key in seen or await self._lead_exists_by_business_location(
+                        db, lead.business_name, lead.location
+                    ):
+                        raise DuplicateLeadError(lead.business_name, lead.location)
+                    seen.add(key)
+                
+                await db.executemany(
+                    self._LEAD_INSERT_SQL,
+                    [self._lead_insert_params(lead) for lead in leads]
+                )
+            
+            return leads
+            
+        except sqlite3.IntegrityError as e:
+            # A unique column (e.g. maps_url) already holds one of these leads
+            if "UNIQUE" not in str(e):
+                raise DatabaseError(f"Failed to create leads: {str(e)}")
+            lead = await self._find_maps_url_conflict(leads)
+            raise DuplicateLeadError(
+                lead.business_name, lead.location, context={"constraint": str(e)}
+            ) from None
+        except Exception as e:
+            if isinstance(e, DatabaseError):
+                raise
+            raise DatabaseError(f"Failed to create leads: {str(e)}")
+    
+    async def _find_maps_url_conflict(self, leads: List[Lead]) -> Lead:
+        """Find the lead whose maps_url is repeated in the batch or already stored.
+        
+        Only runs after a bulk insert failed, so looking leads up one by one
+        is fine; falls back to the first lead if none can be pinned down.
+        """
+        seen = set()
+        for lead in leads:
+            if lead.maps_url and lead.maps_url in seen:
+                return lead
+            seen.add(lead.maps_url)
+        
+        async with self._connect() as db:
+            for lead in leads:
+                if not lead.maps_url:
+                    continue
                 cursor = await db.execute(
-                    "SELECT * FROM leads WHERE id = ?",
-                    (str(lead_id),)
+                    "SELECT 1 FROM leads WHERE maps_url = ? LIMIT 1", (lead.maps_url,)
                 )
-                row = await cursor.fetchone()
-                
-                if not row:
-                    return None
-                
-                return self._row_to_lead(row)
+                if await cursor.fetchone():
+                    return lead
+        return leads[0]
+    
+    @staticmethod
+    def _lead_insert_params(lead: Lead) -> tuple:
+        """Row values for _LEAD_INSERT_SQL."""
+        return (
+            str(lead.id), lead.business_name, lead.category, lead.location,
+            lead.maps_url, lead.website_url, lead.email, lead.phone,
+            lead.discovery_source, float(lead.discovery_confidence) if lead.discovery_confidence else None,
+            json.dumps(lead.discovery_metadata), lead.discovered_at.isoformat(),
+            lead.lifecycle_state, lead.review_status, lead.tag,
+            float(lead.quality_score) if lead.quality_score else None,
+            lead.created_at.isoformat(), lead.updated_at.isoformat(),
+            lead.version, lead.notes, json.dumps(lead.metadata)
+        )
+    
+    async def get_lead_by_id(self, lead_id: UUID) -> Optional[Lead]:
+        """Get lead by ID."""
+        try:
+            async with self._connect() as db:
+                return await self._fetch_lead(db, lead_id)
                 
         except Exception as e:
             raise DatabaseError(f"Failed to get lead {lead_id}: {str(e)}")
     
-    async def update_lead(self, lead_id: UUID, updates: LeadUpdate) -> Lead:
-        """Update lead with optimistic locking."""
+    async def update_lead(self, lead_id: UUID, updates: Union[LeadUpdate, Dict[str, Any]]) -> Lead:
+        """Update lead with optimistic locking and return the updated lead."""
         try:
-            async with self.transaction() as db:
+            async with self.transaction(immediate=True) as db:
                 # Get current lead for version check
-                current_lead = await self.get_lead_by_id(lead_id)
+                current_lead = await self._fetch_lead(db, lead_id)
                 if not current_lead:
                     raise LeadNotFoundError(f"Lead {lead_id} not found")
                 
                 # Prepare update data
-                update_data = updates.dict(exclude_unset=True)
+                if isinstance(updates, LeadUpdate):
+                    update_data = updates.dict(exclude_unset=True)
+                else:
+                    update_data = dict(updates)
                 update_data["updated_at"] = datetime.now()
                 update_data["version"] = current_lead.version + 1
                 
@@ -199,8 +286,9 @@ class ProductionDatabaseService:
                         error_code="CONCURRENT_MODIFICATION"
                     )
                 
-                # Return updated lead
-                return await self.get_lead_by_id(lead_id)
+                # Return updated lead, read on this connection so it sees the
+                # uncommitted update
+                return await self._fetch_lead(db, lead_id)
                 
         except Exception as e:
             if isinstance(e, (DatabaseError, LeadNotFoundError)):
@@ -266,7 +354,7 @@ class ProductionDatabaseService:
             where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
             
             # Get total count
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 cursor = await db.execute(f"SELECT COUNT(*) FROM leads {where_clause}", params)
                 total = (await cursor.fetchone())[0]
                 
@@ -305,7 +393,7 @@ class ProductionDatabaseService:
                 updated_at=datetime.now()
             )
             
-            async with self.transaction() as db:
+            async with self.transaction(immediate=True) as db:
                 await db.execute("""
                     INSERT INTO email_campaigns (
                         id, lead_id, campaign_type, template_id, subject, body_text, body_html,
@@ -330,18 +418,8 @@ class ProductionDatabaseService:
     async def get_email_campaign_by_id(self, campaign_id: UUID) -> Optional[EmailCampaign]:
         """Get email campaign by ID."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                cursor = await db.execute(
-                    "SELECT * FROM email_campaigns WHERE id = ?",
-                    (str(campaign_id),)
-                )
-                row = await cursor.fetchone()
-                
-                if not row:
-                    return None
-                
-                return self._row_to_email_campaign(row)
+            async with self._connect() as db:
+                return await self._fetch_email_campaign(db, campaign_id)
                 
         except Exception as e:
             raise DatabaseError(f"Failed to get email campaign {campaign_id}: {str(e)}")
@@ -353,7 +431,7 @@ class ProductionDatabaseService:
     ) -> EmailCampaign:
         """Update email campaign."""
         try:
-            async with self.transaction() as db:
+            async with self.transaction(immediate=True) as db:
                 # Prepare update data
                 update_data = updates.copy()
                 update_data["updated_at"] = datetime.now()
@@ -380,8 +458,9 @@ class ProductionDatabaseService:
                     WHERE id = ?
                 """, values)
                 
-                # Return updated campaign
-                return await self.get_email_campaign_by_id(campaign_id)
+                # Return updated campaign, read on this connection so it
+                # sees the uncommitted update
+                return await self._fetch_email_campaign(db, campaign_id)
                 
         except Exception as e:
             raise DatabaseError(f"Failed to update email campaign {campaign_id}: {str(e)}")
@@ -389,7 +468,7 @@ class ProductionDatabaseService:
     async def get_email_campaigns_by_state(self, state: EmailState) -> List[EmailCampaign]:
         """Get all email campaigns in a specific state."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute(
                     "SELECT * FROM email_campaigns WHERE email_state = ? ORDER BY created_at ASC",
@@ -406,7 +485,7 @@ class ProductionDatabaseService:
     async def save_audit_log(self, audit_log: AuditLog):
         """Save audit log entry."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 await db.execute("""
                     INSERT INTO audit_log (
                         id, entity_type, entity_id, action, actor, old_values, new_values,
@@ -429,26 +508,63 @@ class ProductionDatabaseService:
         except Exception as e:
             raise DatabaseError(f"Failed to save audit log: {str(e)}")
     
+    _STATE_TRANSITION_INSERT_SQL = """
+        INSERT INTO state_transitions (
+            id, entity_id, entity_type, from_state, to_state, actor, reason, metadata, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _state_transition_params(transition: StateTransition) -> tuple:
+        """Build the state_transitions INSERT parameters for a transition."""
+        return (
+            str(transition.id), str(transition.entity_id), transition.entity_type,
+            transition.from_state, transition.to_state, transition.actor,
+            transition.reason, json.dumps(transition.metadata),
+            transition.created_at.isoformat()
+        )
+    
     async def save_state_transition(self, transition: StateTransition):
         """Save state transition record."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO state_transitions (
-                        id, entity_id, entity_type, from_state, to_state, actor, reason, metadata, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    str(transition.id), str(transition.entity_id), transition.entity_type,
-                    transition.from_state, transition.to_state, transition.actor,
-                    transition.reason, json.dumps(transition.metadata),
-                    transition.created_at.isoformat()
-                ))
+            async with self._connect() as db:
+                await db.execute(self._STATE_TRANSITION_INSERT_SQL, self._state_transition_params(transition))
                 await db.commit()
                 
         except Exception as e:
             raise DatabaseError(f"Failed to save state transition: {str(e)}")
     
     # Helper Methods
+    async def _fetch_lead(self, db: aiosqlite.Connection, lead_id: UUID) -> Optional[Lead]:
+        """Read a lead on an already open connection."""
+        db.row_factory = aiosqlite.Row
+        cursor = await db.execute(
+            "SELECT * FROM leads WHERE id = ?",
+            (str(lead_id),)
+        )
+        row = await cursor.fetchone()
+        
+        if not row:
+            return None
+        
+        return self._row_to_lead(row)
+    
+    async def _fetch_email_campaign(
+        self, db: aiosqlite.Connection, campaign_id: UUID
+    ) -> Optional[EmailCampaign]:
+        """Read an email campaign on an already open connection."""
+        db.row_factory = aiosqlite.Row
+        cursor = await db.execute(
+            "SELECT * FROM email_campaigns WHERE id = ?",
+            (str(campaign_id),)
+        )
+        row = await cursor.fetchone()
+        
+        if not row:
+            return None
+        
+        return self._row_to_email_campaign(row)
+    
     async def _lead_exists_by_business_location(
         self, 
         db: aiosqlite.Connection, 
@@ -491,7 +607,7 @@ class ProductionDatabaseService:
     async def get_email_campaigns_sent_in_period(self, start_time: datetime, end_time: datetime) -> List[EmailCampaign]:
         """Get email campaigns sent in a specific time period."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute("""
                     SELECT * FROM email_campaigns 
@@ -509,7 +625,7 @@ class ProductionDatabaseService:
     async def get_leads_by_business_location(self, business_name: str, location: str) -> List[Lead]:
         """Get leads by business name and location (for duplicate checking)."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute("""
                     SELECT * FROM leads 
@@ -522,12 +638,21 @@ class ProductionDatabaseService:
         except Exception as e:
             raise DatabaseError(f"Failed to get leads by business/location: {str(e)}")
     
-    async def update_lead_state(self, lead_id: UUID, new_state: Dict[str, Any]) -> Lead:
-        """Update lead state with proper validation."""
+    async def update_lead_state(
+        self,
+        lead_id: UUID,
+        new_state: Dict[str, Any],
+        transitions: Sequence[StateTransition] = ()
+    ) -> Lead:
+        """Update lead state with proper validation.
+        
+        Any state transition records passed in are inserted in the same
+        transaction, so they commit or roll back together with the update.
+        """
         try:
-            async with self.transaction() as db:
+            async with self.transaction(immediate=True) as db:
                 # Get current lead for version check
-                current_lead = await self.get_lead_by_id(lead_id)
+                current_lead = await self._fetch_lead(db, lead_id)
                 if not current_lead:
                     raise LeadNotFoundError(f"Lead {lead_id} not found")
                 
@@ -567,8 +692,15 @@ class ProductionDatabaseService:
                         error_code="CONCURRENT_MODIFICATION"
                     )
                 
-                # Return updated lead
-                return await self.get_lead_by_id(lead_id)
+                if transitions:
+                    await db.executemany(
+                        self._STATE_TRANSITION_INSERT_SQL,
+                        [self._state_transition_params(transition) for transition in transitions]
+                    )
+                
+                # Return updated lead, read on this connection so it sees the
+                # uncommitted update
+                return await self._fetch_lead(db, lead_id)
                 
         except Exception as e:
             if isinstance(e, (DatabaseError, LeadNotFoundError)):
@@ -616,7 +748,7 @@ class ProductionDatabaseService:
             
             where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute(f"""
                     SELECT * FROM audit_log {where_clause}
@@ -635,7 +767,7 @@ class ProductionDatabaseService:
         try:
             cutoff_date = datetime.now() - timedelta(days=retention_days)
             
-            async with self.transaction() as db:
+            async with self.transaction(immediate=True) as db:
                 # Clean up old audit logs
                 await db.execute(
                     "DELETE FROM audit_log WHERE created_at < ?",
@@ -666,7 +798,7 @@ class ProductionDatabaseService:
         try:
             stats = {}
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 # Get table counts
                 tables = ['leads', 'email_campaigns', 'audit_log', 'state_transitions']
                 
@@ -732,7 +864,7 @@ class ProductionDatabaseService:
     async def get_all_campaigns(self, limit: Optional[int] = None) -> List[EmailCampaign]:
         """Get all email campaigns for analytics."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 query = "SELECT * FROM email_campaigns ORDER BY created_at DESC"
                 if limit:
@@ -747,7 +879,7 @@ class ProductionDatabaseService:
     async def get_campaigns_by_range(self, start_date: datetime, end_date: datetime) -> List[EmailCampaign]:
         """Get campaigns within a date range."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute("""
                     SELECT * FROM email_campaigns 
@@ -762,7 +894,7 @@ class ProductionDatabaseService:
     async def get_all_leads_for_analytics(self) -> List[Lead]:
         """Get all leads for analytics (warning: can be large)."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute("SELECT * FROM leads")
                 rows = await cursor.fetchall()
@@ -770,11 +902,43 @@ class ProductionDatabaseService:
         except Exception as e:
             raise DatabaseError(f"Failed to get all leads: {str(e)}")
 
+    async def iter_all_leads(self, batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all leads as raw row dicts, batch_size rows per query.
+        
+        Pages are keyset-paginated on (created_at, id) rather than OFFSET, so
+        each page is an index range scan, and every page runs on its own short
+        connection so no read transaction is held open between pages.
+        """
+        last_key = None
+        while True:
+            try:
+                async with self._connect() as db:
+                    db.row_factory = aiosqlite.Row
+                    if last_key is None:
+                        cursor = await db.execute(
+                            "SELECT * FROM leads ORDER BY created_at, id LIMIT ?",
+                            (batch_size,)
+                        )
+                    else:
+                        cursor = await db.execute("""
+                            SELECT * FROM leads WHERE (created_at, id) > (?, ?)
+                            ORDER BY created_at, id LIMIT ?
+                        """, (*last_key, batch_size))
+                    rows = await cursor.fetchall()
+            except Exception as e:
+                raise DatabaseError(f"Failed to iterate leads: {str(e)}")
+            
+            for row in rows:
+                yield dict(row)
+            if len(rows) < batch_size:
+                return
+            last_key = (rows[-1]["created_at"], rows[-1]["id"])
+
     # --- Campaign / Sequence Methods ---
 
     async def create_sequence(self, sequence: EmailSequence) -> EmailSequence:
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 await db.execute("""
                     INSERT INTO email_sequences (
                         id, name, description, status, steps, auto_pause_on_reply,
@@ -795,7 +959,7 @@ class ProductionDatabaseService:
 
     async def get_sequence(self, sequence_id: UUID) -> Optional[EmailSequence]:
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute("SELECT * FROM email_sequences WHERE id = ?", (str(sequence_id),))
                 row = await cursor.fetchone()
@@ -828,7 +992,7 @@ class ProductionDatabaseService:
 
     async def update_sequence(self, sequence: EmailSequence):
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 await db.execute("""
                     UPDATE email_sequences SET
                         name=?, description=?, status=?, steps=?, auto_pause_on_reply=?,
@@ -851,7 +1015,7 @@ class ProductionDatabaseService:
 
     async def create_enrollment(self, enrollment: LeadSequenceEnrollment) -> LeadSequenceEnrollment:
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 await db.execute("""
                     INSERT INTO sequence_enrollments (
                         id, sequence_id, lead_id, status, current_step_index,
@@ -878,7 +1042,7 @@ class ProductionDatabaseService:
 
     async def update_enrollment(self, enrollment: LeadSequenceEnrollment):
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 await db.execute("""
                     UPDATE sequence_enrollments SET
                         status=?, current_step_index=?, next_step_scheduled=?,
@@ -903,7 +1067,7 @@ class ProductionDatabaseService:
 
     async def get_enrollment(self, enrollment_id: UUID) -> Optional[LeadSequenceEnrollment]:
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute("SELECT * FROM sequence_enrollments WHERE id = ?", (str(enrollment_id),))
                 row = await cursor.fetchone()
@@ -914,7 +1078,7 @@ class ProductionDatabaseService:
 
     async def get_enrollments(self, sequence_id: Optional[UUID] = None, lead_id: Optional[UUID] = None) -> List[LeadSequenceEnrollment]:
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 query = "SELECT * FROM sequence_enrollments WHERE 1=1"
                 params = []
@@ -934,7 +1098,7 @@ class ProductionDatabaseService:
     async def get_pending_enrollments(self) -> List[LeadSequenceEnrollment]:
         try:
             now = datetime.now()
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute("""
                     SELECT * FROM sequence_enrollments 
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -24,6 +25,9 @@ class ActionLogger:
         
         # Database service (lazy loaded to avoid circular imports)
         self._db = None
+        
+        # Serializes the read-modify-write of the JSON log across threads
+        self._json_lock = threading.Lock()
     
     @property
     def db(self):
@@ -107,6 +111,11 @@ class ActionLogger:
     
     def _append_json_log(self, entry: dict):
         """Append entry to JSON log file."""
+        with self._json_lock:
+            self._append_json_log_locked(entry)
+    
+    def _append_json_log_locked(self, entry: dict):
+        """Append entry to JSON log file; caller holds the JSON log lock."""
         try:
             logs = []
             if self.json_log_path.exists():
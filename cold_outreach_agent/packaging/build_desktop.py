@@ -12,7 +12,6 @@ Usage:
     python packaging/build_desktop.py --onefile  # Single executable
 """
 
-import os
 import sys
 import shutil
 import subprocess
@@ -105,9 +104,6 @@ def build_backend(project_root, onefile=False):
     """Build the backend with PyInstaller."""
     print("\n[3/4] Building backend with PyInstaller...")
     
-    # Change to project directory
-    os.chdir(project_root)
-    
     # Build command
     cmd = [
         sys.executable, '-m', 'PyInstaller',
@@ -142,7 +138,8 @@ def build_backend(project_root, onefile=False):
     
     print(f"  Command: {' '.join(cmd)}")
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Run from the project directory without changing our own cwd
+    result = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True)
     
     if result.returncode != 0:
         print(f"  ERROR: PyInstaller failed")
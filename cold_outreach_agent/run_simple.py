@@ -6,7 +6,6 @@ No Docker required - just Python
 
 import subprocess
 import sys
-import os
 from pathlib import Path
 
 def check_dependencies():
@@ -42,7 +41,7 @@ def start_server():
             "--host", "0.0.0.0",
             "--port", "8000",
             "--reload"
-        ])
+        ], cwd=Path(__file__).parent)
     except KeyboardInterrupt:
         print("\n🛑 Server stopped")
 
@@ -50,8 +49,5 @@ if __name__ == "__main__":
     print("🐍 Cold Outreach Agent - Simple Python Startup")
     print("=" * 50)
     
-    # Change to the script directory
-    os.chdir(Path(__file__).parent)
-    
     check_dependencies()
     start_server()
\ No newline at end of file
@@ -9,7 +9,7 @@ import asyncio
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 
 from ..config.settings import settings
 
@@ -133,6 +133,18 @@ class DatabaseService:
             async with db.execute("SELECT * FROM leads ORDER BY discovered_at DESC") as cursor:
                 return [dict(row) for row in await cursor.fetchall()]
     
+    async def iter_all_leads(self, batch_size: int = 1000) -> AsyncIterator[dict]:
+        """Stream all leads, fetching batch_size rows at a time."""
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute("SELECT * FROM leads ORDER BY discovered_at DESC") as cursor:
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield dict(row)
+    
     async def get_lead_by_id(self, lead_id: str) -> Optional[dict]:
         """Get a single lead by ID."""
         async with aiosqlite.connect(self.db_path) as db:
@@ -1,9 +1,11 @@
 """Advanced multi-factor lead scoring engine."""
 
+import sys
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
-from uuid import UUID
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+from uuid import UUID, uuid4
 
 from ..core.models.scoring import (
     LeadScore, ScoreComponent, ScoreCategory, ScoreLevel, ScoreExplanation,
@@ -14,6 +16,19 @@ from ..core.exceptions import ColdOutreachAgentError
 from ..modules.logger import action_logger
 
 
+# Recency decay step function: ages (days) up to and including each boundary
+# map to the decay at the same index; anything older gets the last decay.
+_AGE_BOUNDARIES = (7, 14, 30, 60, 90)
+_AGE_DECAYS = (
+    Decimal("1.0"), Decimal("0.9"), Decimal("0.7"),
+    Decimal("0.5"), Decimal("0.3"), Decimal("0.1"),
+)
+
+
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11 onwards
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
 class ScoringError(ColdOutreachAgentError):
     """Scoring operation failed."""
     pass
@@ -41,29 +56,112 @@ class LeadScoringEngine:
         ScoreCategory.OUTREACH_READINESS: Decimal("0.20"),
     }
     
+    # Relevance bonus by business maturity
+    MATURITY_SCORES: Dict[BusinessMaturity, Decimal] = {
+        BusinessMaturity.EARLY_STAGE: Decimal("0.2"),
+        BusinessMaturity.SCALING: Decimal("0.15"),
+        BusinessMaturity.MVP: Decimal("0.1"),
+        BusinessMaturity.MATURE: Decimal("0.05"),
+    }
+    
+    # Order in which component scores are combined into the composite
+    COMPONENT_ORDER = (
+        ScoreCategory.INTENT,
+        ScoreCategory.RELEVANCE,
+        ScoreCategory.RECENCY,
+        ScoreCategory.INDUSTRY_FIT,
+        ScoreCategory.OUTREACH_READINESS,
+    )
+    
     # Target industries (configurable)
-    DEFAULT_TARGET_INDUSTRIES = [
+    DEFAULT_TARGET_INDUSTRIES = (
         'restaurant', 'cafe', 'bar', 'hotel', 'salon', 'spa', 'gym', 'fitness',
         'dental', 'medical', 'clinic', 'real estate', 'law', 'legal', 'accounting',
         'consulting', 'retail', 'store', 'shop', 'boutique', 'auto', 'repair',
         'plumber', 'electrician', 'contractor', 'cleaning', 'landscaping'
-    ]
+    )
     
     def __init__(self, db_service, 
                  weights: Dict[ScoreCategory, Decimal] = None,
-                 target_industries: List[str] = None):
+                 target_industries: Sequence[str] = None):
         self.db = db_service
         self.weights = weights or self.DEFAULT_WEIGHTS
         self.target_industries = target_industries or self.DEFAULT_TARGET_INDUSTRIES
         self.custom_rules: List[ScoringRule] = []
+        # Rules bucketed by the lead field they read; a rule in this index can
+        # only match when its field is present on the lead.
+        self._rules_by_field: Dict[str, List[ScoringRule]] = {}
+        # Rules that must be evaluated for every lead
+        self._always_rules: List[ScoringRule] = []
+        # Lowercased MATCH rule values, computed once per rule in add_rule
+        self._match_values_lower: Dict[UUID, Tuple[str, ...]] = {}
     
     def add_rule(self, rule: ScoringRule):
         """Add a custom scoring rule."""
         self.custom_rules.append(rule)
+        if rule.rule_type == ScoringRuleType.MATCH:
+            self._match_values_lower[rule.id] = tuple(
+                m.lower() for m in rule.parameters.get('values', [])
+            )
+        self._index_rule(rule)
     
     def clear_rules(self):
         """Clear all custom rules."""
         self.custom_rules = []
+        self._rules_by_field = {}
+        self._always_rules = []
+        self._match_values_lower = {}
+    
+    def _index_rule(self, rule: ScoringRule):
+        """File a rule under its referenced field, or in the always-evaluate bucket."""
+        field = rule.parameters.get('field')
+        if field and field != '*' and self._rule_misses_without_field(rule):
+            self._rules_by_field.setdefault(field, []).append(rule)
+        else:
+            self._always_rules.append(rule)
+    
+    @staticmethod
+    def _rule_misses_without_field(rule: ScoringRule) -> bool:
+        """Check whether a rule is guaranteed to contribute 0 when its field is absent."""
+        params = rule.parameters
+        
+        if rule.rule_type == ScoringRuleType.BOOLEAN:
+            # Absent field reads as None, which only matches a None target
+            return params.get('target', True) is not None
+        
+        elif rule.rule_type == ScoringRuleType.THRESHOLD:
+            # Absent field reads as 0
+            threshold = params.get('threshold', 0)
+            return isinstance(threshold, (int, float, Decimal)) and threshold > 0
+        
+        elif rule.rule_type == ScoringRuleType.MATCH:
+            # Absent field reads as '', which only an empty pattern matches
+            return all(params.get('values', []))
+        
+        # Other rule types never contribute
+        return True
+    
+    @property
+    def target_industries(self) -> Sequence[str]:
+        """Industries that count as a category match."""
+        return self._target_industries
+    
+    @target_industries.setter
+    def target_industries(self, industries: Sequence[str]):
+        self._target_industries = industries
+        # (original, lowercased) pairs so matching never re-lowers an industry
+        self._target_industries_lower = tuple((ind, ind.lower()) for ind in industries)
+    
+    @property
+    def weights(self) -> Dict[ScoreCategory, Decimal]:
+        """Composite score weights by category."""
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: Dict[ScoreCategory, Decimal]):
+        self._weights = weights
+        # Weights in component order, so the composite is a single pass
+        self._weight_vector = tuple(weights[category] for category in self.COMPONENT_ORDER)
     
     def update_weights(self, weights: Dict[ScoreCategory, Decimal]):
         """Update scoring weights."""
@@ -73,39 +171,69 @@ class LeadScoringEngine:
             raise ScoringError(f"Weights must sum to 1.0, got {total}")
         self.weights = weights
     
-    async def score_lead(self, lead: Dict[str, Any], 
-                          enrichment: Optional[LeadEnrichment] = None) -> LeadScore:
+    def score_lead(self, lead: Dict[str, Any], 
+                    enrichment: Optional[LeadEnrichment] = None,
+                    explain: bool = True,
+                    now: Optional[datetime] = None,
+                    lead_id: Optional[UUID] = None,
+                    rules: Optional[Tuple] = None) -> LeadScore:
         """
         Calculate comprehensive lead score.
         
         Args:
             lead: Lead data dictionary
             enrichment: Optional enrichment data
+            explain: Build per-factor explanations; disable for ranking
+                workloads that only need the scores
+            now: Reference time for recency; batch callers pass one value
+                for the whole batch
+            lead_id: Already-parsed lead id; read from the lead when omitted
+            rules: Weights and rules frozen by _snapshot_rules; batch callers
+                pass one snapshot for the whole batch
         
         Returns:
             LeadScore with all components and composite score
         """
-        lead_id_val = lead.get('lead_id') or lead.get('id')
-        lead_id = UUID(str(lead_id_val)) if lead_id_val else uuid4()
+        weight_vector, always_rules, rules_by_field, rules_applied = (
+            rules or self._snapshot_rules()
+        )
+        
+        if lead_id is None:
+            lead_id_val = lead.get('lead_id') or lead.get('id')
+            lead_id = UUID(str(lead_id_val)) if lead_id_val else uuid4()
+        
+        # Read each lead field once and share it across the components
+        email = lead.get('email')
+        website_url = lead.get('website_url')
+        tag = lead.get('tag', '')
+        category = (lead.get('category') or '').lower()
+        discovered_at = lead.get('discovered_at') or lead.get('created_at')
+        review_status = lead.get('review_status', 'pending')
+        outreach_status = lead.get('outreach_status', 'not_sent')
         
         # Calculate each component score
-        intent_score = self._calculate_intent_score(lead, enrichment)
-        relevance_score = self._calculate_relevance_score(lead, enrichment)
-        recency_score = self._calculate_recency_score(lead)
-        industry_fit_score = self._calculate_industry_fit_score(lead)
-        outreach_readiness_score = self._calculate_outreach_readiness_score(lead, enrichment)
+        intent_score = self._calculate_intent_score(website_url, tag, enrichment, explain)
+        relevance_score = self._calculate_relevance_score(email, website_url, enrichment, explain)
+        recency_score = self._calculate_recency_score(discovered_at, explain, now)
+        industry_fit_score = self._calculate_industry_fit_score(category, explain)
+        outreach_readiness_score = self._calculate_outreach_readiness_score(
+            email, review_status, outreach_status, enrichment, explain
+        )
         
         # Calculate composite score
-        composite = (
-            intent_score.score * self.weights[ScoreCategory.INTENT] +
-            relevance_score.score * self.weights[ScoreCategory.RELEVANCE] +
-            recency_score.score * self.weights[ScoreCategory.RECENCY] +
-            industry_fit_score.score * self.weights[ScoreCategory.INDUSTRY_FIT] +
-            outreach_readiness_score.score * self.weights[ScoreCategory.OUTREACH_READINESS]
+        composite = sum(
+            component.score * weight
+            for component, weight in zip(
+                (intent_score, relevance_score, recency_score,
+                 industry_fit_score, outreach_readiness_score),
+                weight_vector
+            )
         )
         
         # Apply custom rules
-        composite = self._apply_custom_rules(composite, lead, enrichment)
+        composite = self._apply_custom_rules(
+            composite, lead, enrichment, always_rules, rules_by_field
+        )
         
         # Ensure within bounds
         composite = max(Decimal("0.0"), min(Decimal("1.0"), composite))
@@ -120,7 +248,7 @@ class LeadScoringEngine:
             outreach_readiness_score=outreach_readiness_score,
             composite_score=composite,
             composite_level=ScoreComponent._score_to_level(composite),
-            rules_applied=[r.name for r in self.custom_rules if r.is_active]
+            rules_applied=list(rules_applied)
         )
         
         action_logger.log_action(
@@ -133,8 +261,19 @@ class LeadScoringEngine:
         
         return lead_score
     
-    def _calculate_intent_score(self, lead: Dict[str, Any], 
-                                 enrichment: Optional[LeadEnrichment]) -> ScoreComponent:
+    def score_lead_ranking(self, lead: Dict[str, Any],
+                           enrichment: Optional[LeadEnrichment] = None) -> float:
+        """
+        Fast path returning only the composite score, for ranking and filtering.
+        
+        Factor explanations are skipped; re-run score_lead on the leads that
+        are actually displayed to get the full breakdown.
+        """
+        return float(self.score_lead(lead, enrichment, explain=False).composite_score)
+    
+    def _calculate_intent_score(self, website_url: Optional[str], tag: str,
+                                 enrichment: Optional[LeadEnrichment],
+                                 explain: bool = True) -> ScoreComponent:
         """
         Calculate intent score based on signals indicating need for services.
         
@@ -148,64 +287,66 @@ class LeadScoringEngine:
         base_score = Decimal("0.5")
         
         # Website status factor
-        website_url = lead.get('website_url')
-        tag = lead.get('tag', '')
-        
         if not website_url or tag == 'no_website':
-            factors.append(ScoreExplanation(
-                factor_name="No Website",
-                factor_weight=Decimal("0.3"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.3"),
-                explanation="Business has no website - high intent signal",
-                data_points=["No website detected"]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="No Website",
+                    factor_weight=Decimal("0.3"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.3"),
+                    explanation="Business has no website - high intent signal",
+                    data_points=["No website detected"]
+                ))
             base_score += Decimal("0.3")
         elif tag == 'outdated_site':
-            factors.append(ScoreExplanation(
-                factor_name="Outdated Website",
-                factor_weight=Decimal("0.2"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.2"),
-                explanation="Website appears outdated",
-                data_points=["Website needs refresh"]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Outdated Website",
+                    factor_weight=Decimal("0.2"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.2"),
+                    explanation="Website appears outdated",
+                    data_points=["Website needs refresh"]
+                ))
             base_score += Decimal("0.2")
         elif tag == 'no_cta':
-            factors.append(ScoreExplanation(
-                factor_name="Missing CTA",
-                factor_weight=Decimal("0.15"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.15"),
-                explanation="Website lacks clear calls to action",
-                data_points=["No contact forms or CTAs"]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Missing CTA",
+                    factor_weight=Decimal("0.15"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.15"),
+                    explanation="Website lacks clear calls to action",
+                    data_points=["No contact forms or CTAs"]
+                ))
             base_score += Decimal("0.15")
         
         # Enrichment-based factors
         if enrichment:
             # Hiring tech workers = potential budget for dev work
             if enrichment.is_hiring:
-                factors.append(ScoreExplanation(
-                    factor_name="Hiring",
-                    factor_weight=Decimal("0.1"),
-                    raw_value=Decimal("1.0"),
-                    weighted_value=Decimal("0.1"),
-                    explanation="Company is actively hiring, indicates growth",
-                    data_points=[f"Found {len(enrichment.hiring_signals)} hiring signals"]
-                ))
+                if explain:
+                    factors.append(ScoreExplanation(
+                        factor_name="Hiring",
+                        factor_weight=Decimal("0.1"),
+                        raw_value=Decimal("1.0"),
+                        weighted_value=Decimal("0.1"),
+                        explanation="Company is actively hiring, indicates growth",
+                        data_points=[f"Found {len(enrichment.hiring_signals)} hiring signals"]
+                    ))
                 base_score += Decimal("0.1")
             
             # No live chat = opportunity
             if not enrichment.has_live_chat:
-                factors.append(ScoreExplanation(
-                    factor_name="No Live Chat",
-                    factor_weight=Decimal("0.05"),
-                    raw_value=Decimal("1.0"),
-                    weighted_value=Decimal("0.05"),
-                    explanation="No live chat solution detected",
-                    data_points=["Missing chat widget"]
-                ))
+                if explain:
+                    factors.append(ScoreExplanation(
+                        factor_name="No Live Chat",
+                        factor_weight=Decimal("0.05"),
+                        raw_value=Decimal("1.0"),
+                        weighted_value=Decimal("0.05"),
+                        explanation="No live chat solution detected",
+                        data_points=["Missing chat widget"]
+                    ))
                 base_score += Decimal("0.05")
         
         # Ensure within bounds
@@ -218,8 +359,9 @@ class LeadScoringEngine:
             confidence=Decimal("0.7") if enrichment else Decimal("0.5")
         )
     
-    def _calculate_relevance_score(self, lead: Dict[str, Any],
-                                    enrichment: Optional[LeadEnrichment]) -> ScoreComponent:
+    def _calculate_relevance_score(self, email: Optional[str], website_url: Optional[str],
+                                    enrichment: Optional[LeadEnrichment],
+                                    explain: bool = True) -> ScoreComponent:
         """
         Calculate relevance score based on fit with target profile.
         
@@ -233,63 +375,59 @@ class LeadScoringEngine:
         base_score = Decimal("0.3")
         
         # Email availability
-        email = lead.get('email')
         if email:
-            factors.append(ScoreExplanation(
-                factor_name="Has Email",
-                factor_weight=Decimal("0.3"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.3"),
-                explanation="Valid email address available",
-                data_points=[email[:20] + "..."]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Has Email",
+                    factor_weight=Decimal("0.3"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.3"),
+                    explanation="Valid email address available",
+                    data_points=[email[:20] + "..."]
+                ))
             base_score += Decimal("0.3")
         
         # Website available
-        website_url = lead.get('website_url')
         if website_url:
-            factors.append(ScoreExplanation(
-                factor_name="Has Website",
-                factor_weight=Decimal("0.1"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.1"),
-                explanation="Website available for analysis",
-                data_points=[]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Has Website",
+                    factor_weight=Decimal("0.1"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.1"),
+                    explanation="Website available for analysis",
+                    data_points=[]
+                ))
             base_score += Decimal("0.1")
         
         # Enrichment-based relevance
         if enrichment:
             # Business maturity - prefer early stage to scaling
-            maturity_scores = {
-                BusinessMaturity.EARLY_STAGE: Decimal("0.2"),
-                BusinessMaturity.SCALING: Decimal("0.15"),
-                BusinessMaturity.MVP: Decimal("0.1"),
-                BusinessMaturity.MATURE: Decimal("0.05"),
-            }
-            maturity_value = maturity_scores.get(enrichment.business_maturity, Decimal("0.0"))
+            maturity_value = self.MATURITY_SCORES.get(enrichment.business_maturity, Decimal("0.0"))
             if maturity_value > 0:
-                factors.append(ScoreExplanation(
-                    factor_name="Business Maturity",
-                    factor_weight=Decimal("0.2"),
-                    raw_value=maturity_value,
-                    weighted_value=maturity_value,
-                    explanation=f"Business stage: {enrichment.business_maturity}",
-                    data_points=[enrichment.business_maturity.value if hasattr(enrichment.business_maturity, 'value') else str(enrichment.business_maturity)]
-                ))
+                if explain:
+                    factors.append(ScoreExplanation(
+                        factor_name="Business Maturity",
+                        factor_weight=Decimal("0.2"),
+                        raw_value=maturity_value,
+                        weighted_value=maturity_value,
+                        explanation=f"Business stage: {enrichment.business_maturity}",
+                        data_points=[enrichment.business_maturity.value if hasattr(enrichment.business_maturity, 'value') else str(enrichment.business_maturity)]
+                    ))
                 base_score += maturity_value
             
             # Social presence indicates legitimacy
             if enrichment.social_presences:
                 social_bonus = min(len(enrichment.social_presences) * Decimal("0.03"), Decimal("0.1"))
-                factors.append(ScoreExplanation(
-                    factor_name="Social Presence",
-                    factor_weight=Decimal("0.1"),
-                    raw_value=social_bonus,
-                    weighted_value=social_bonus,
-                    explanation="Active on social platforms",
-                    data_points=[p.platform for p in enrichment.social_presences[:3]]
-                ))
+                if explain:
+                    factors.append(ScoreExplanation(
+                        factor_name="Social Presence",
+                        factor_weight=Decimal("0.1"),
+                        raw_value=social_bonus,
+                        weighted_value=social_bonus,
+                        explanation="Active on social platforms",
+                        data_points=[p.platform for p in enrichment.social_presences[:3]]
+                    ))
                 base_score += social_bonus
         
         base_score = max(Decimal("0.0"), min(Decimal("1.0"), base_score))
@@ -301,7 +439,9 @@ class LeadScoringEngine:
             confidence=Decimal("0.75") if email else Decimal("0.4")
         )
     
-    def _calculate_recency_score(self, lead: Dict[str, Any]) -> ScoreComponent:
+    def _calculate_recency_score(self, discovered_at_str: Any,
+                                 explain: bool = True,
+                                 now: Optional[datetime] = None) -> ScoreComponent:
         """
         Calculate recency score based on data freshness.
         
@@ -313,40 +453,37 @@ class LeadScoringEngine:
         factors = []
         
         # Parse discovery date
-        discovered_at_str = lead.get('discovered_at') or lead.get('created_at')
         if discovered_at_str:
+            if now is None:
+                now = datetime.now()
+            
             if isinstance(discovered_at_str, str):
                 try:
-                    discovered_at = datetime.fromisoformat(discovered_at_str.replace('Z', '+00:00'))
+                    if _FROMISOFORMAT_ACCEPTS_Z:
+                        discovered_at = datetime.fromisoformat(discovered_at_str)
+                    else:
+                        discovered_at = datetime.fromisoformat(discovered_at_str.replace('Z', '+00:00'))
                 except:
-                    discovered_at = datetime.now()
+                    discovered_at = now
             else:
                 discovered_at = discovered_at_str
             
-            age_days = (datetime.now() - discovered_at.replace(tzinfo=None)).days
+            if discovered_at.tzinfo is not None:
+                discovered_at = discovered_at.replace(tzinfo=None)
+            age_days = (now - discovered_at).days
             
             # Decay function: 1.0 at 0 days, ~0.5 at 30 days, ~0.1 at 90 days
-            if age_days <= 7:
-                decay = Decimal("1.0")
-            elif age_days <= 14:
-                decay = Decimal("0.9")
-            elif age_days <= 30:
-                decay = Decimal("0.7")
-            elif age_days <= 60:
-                decay = Decimal("0.5")
-            elif age_days <= 90:
-                decay = Decimal("0.3")
-            else:
-                decay = Decimal("0.1")
+            decay = _AGE_DECAYS[bisect_left(_AGE_BOUNDARIES, age_days)]
             
-            factors.append(ScoreExplanation(
-                factor_name="Data Age",
-                factor_weight=Decimal("1.0"),
-                raw_value=decay,
-                weighted_value=decay,
-                explanation=f"Data is {age_days} days old",
-                data_points=[f"Discovered: {discovered_at.strftime('%Y-%m-%d')}"]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Data Age",
+                    factor_weight=Decimal("1.0"),
+                    raw_value=decay,
+                    weighted_value=decay,
+                    explanation=f"Data is {age_days} days old",
+                    data_points=[f"Discovered: {discovered_at.strftime('%Y-%m-%d')}"]
+                ))
             
             return ScoreComponent.from_score(
                 category=ScoreCategory.RECENCY,
@@ -363,7 +500,8 @@ class LeadScoringEngine:
             confidence=Decimal("0.3")
         )
     
-    def _calculate_industry_fit_score(self, lead: Dict[str, Any]) -> ScoreComponent:
+    def _calculate_industry_fit_score(self, category: str,
+                                      explain: bool = True) -> ScoreComponent:
         """
         Calculate industry fit score.
         
@@ -374,32 +512,32 @@ class LeadScoringEngine:
         factors = []
         base_score = Decimal("0.3")  # Default for unknown industry
         
-        category = (lead.get('category') or '').lower()
-        
         if category:
             # Check against target industries
-            matched_industries = [ind for ind in self.target_industries 
-                                  if ind.lower() in category]
+            matched_industries = [ind for ind, ind_lower in self._target_industries_lower
+                                  if ind_lower in category]
             
             if matched_industries:
-                factors.append(ScoreExplanation(
-                    factor_name="Industry Match",
-                    factor_weight=Decimal("0.7"),
-                    raw_value=Decimal("1.0"),
-                    weighted_value=Decimal("0.7"),
-                    explanation=f"Industry matches target: {category}",
-                    data_points=matched_industries[:3]
-                ))
+                if explain:
+                    factors.append(ScoreExplanation(
+                        factor_name="Industry Match",
+                        factor_weight=Decimal("0.7"),
+                        raw_value=Decimal("1.0"),
+                        weighted_value=Decimal("0.7"),
+                        explanation=f"Industry matches target: {category}",
+                        data_points=matched_industries[:3]
+                    ))
                 base_score = Decimal("0.9")
             else:
-                factors.append(ScoreExplanation(
-                    factor_name="Industry Partial",
-                    factor_weight=Decimal("0.3"),
-                    raw_value=Decimal("0.5"),
-                    weighted_value=Decimal("0.15"),
-                    explanation=f"Industry not in primary targets: {category}",
-                    data_points=[]
-                ))
+                if explain:
+                    factors.append(ScoreExplanation(
+                        factor_name="Industry Partial",
+                        factor_weight=Decimal("0.3"),
+                        raw_value=Decimal("0.5"),
+                        weighted_value=Decimal("0.15"),
+                        explanation=f"Industry not in primary targets: {category}",
+                        data_points=[]
+                    ))
                 base_score = Decimal("0.4")
         
         return ScoreComponent.from_score(
@@ -409,8 +547,10 @@ class LeadScoringEngine:
             confidence=Decimal("0.8") if category else Decimal("0.3")
         )
     
-    def _calculate_outreach_readiness_score(self, lead: Dict[str, Any],
-                                             enrichment: Optional[LeadEnrichment]) -> ScoreComponent:
+    def _calculate_outreach_readiness_score(self, email: Optional[str],
+                                             review_status: str, outreach_status: str,
+                                             enrichment: Optional[LeadEnrichment],
+                                             explain: bool = True) -> ScoreComponent:
         """
         Calculate outreach readiness score.
         
@@ -424,18 +564,18 @@ class LeadScoringEngine:
         base_score = Decimal("0.0")
         
         # Email is required
-        email = lead.get('email')
         if email and '@' in email:
-            factors.append(ScoreExplanation(
-                factor_name="Email Ready",
-                factor_weight=Decimal("0.4"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.4"),
-                explanation="Valid email address for outreach",
-                data_points=[]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Email Ready",
+                    factor_weight=Decimal("0.4"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.4"),
+                    explanation="Valid email address for outreach",
+                    data_points=[]
+                ))
             base_score += Decimal("0.4")
-        else:
+        elif explain:
             factors.append(ScoreExplanation(
                 factor_name="No Email",
                 factor_weight=Decimal("0.4"),
@@ -446,51 +586,53 @@ class LeadScoringEngine:
             ))
         
         # Review status
-        review_status = lead.get('review_status', 'pending')
         if review_status == 'approved':
-            factors.append(ScoreExplanation(
-                factor_name="Approved",
-                factor_weight=Decimal("0.3"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.3"),
-                explanation="Lead approved for outreach",
-                data_points=[]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Approved",
+                    factor_weight=Decimal("0.3"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.3"),
+                    explanation="Lead approved for outreach",
+                    data_points=[]
+                ))
             base_score += Decimal("0.3")
         elif review_status == 'pending':
-            factors.append(ScoreExplanation(
-                factor_name="Pending Review",
-                factor_weight=Decimal("0.3"),
-                raw_value=Decimal("0.5"),
-                weighted_value=Decimal("0.15"),
-                explanation="Lead pending review",
-                data_points=[]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Pending Review",
+                    factor_weight=Decimal("0.3"),
+                    raw_value=Decimal("0.5"),
+                    weighted_value=Decimal("0.15"),
+                    explanation="Lead pending review",
+                    data_points=[]
+                ))
             base_score += Decimal("0.15")
         
         # Outreach status
-        outreach_status = lead.get('outreach_status', 'not_sent')
         if outreach_status == 'not_sent':
-            factors.append(ScoreExplanation(
-                factor_name="Fresh Lead",
-                factor_weight=Decimal("0.2"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.2"),
-                explanation="Never contacted before",
-                data_points=[]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Fresh Lead",
+                    factor_weight=Decimal("0.2"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.2"),
+                    explanation="Never contacted before",
+                    data_points=[]
+                ))
             base_score += Decimal("0.2")
         
         # Decision maker available
         if enrichment and enrichment.primary_contact:
-            factors.append(ScoreExplanation(
-                factor_name="Decision Maker",
-                factor_weight=Decimal("0.1"),
-                raw_value=Decimal("1.0"),
-                weighted_value=Decimal("0.1"),
-                explanation=f"Decision maker identified: {enrichment.primary_contact.name}",
-                data_points=[enrichment.primary_contact.title or "Unknown title"]
-            ))
+            if explain:
+                factors.append(ScoreExplanation(
+                    factor_name="Decision Maker",
+                    factor_weight=Decimal("0.1"),
+                    raw_value=Decimal("1.0"),
+                    weighted_value=Decimal("0.1"),
+                    explanation=f"Decision maker identified: {enrichment.primary_contact.name}",
+                    data_points=[enrichment.primary_contact.title or "Unknown title"]
+                ))
             base_score += Decimal("0.1")
         
         base_score = max(Decimal("0.0"), min(Decimal("1.0"), base_score))
@@ -502,23 +644,53 @@ class LeadScoringEngine:
             confidence=Decimal("0.9") if email else Decimal("0.2")
         )
     
+    def _snapshot_rules(self) -> Tuple:
+        """Freeze the weights and rule indexes so every lead sees the same rules."""
+        return (
+            self._weight_vector,
+            tuple(self._always_rules),
+            {field: tuple(rules) for field, rules in self._rules_by_field.items()},
+            tuple(r.name for r in self.custom_rules if r.is_active),
+        )
+    
     def _apply_custom_rules(self, score: Decimal, lead: Dict[str, Any],
-                            enrichment: Optional[LeadEnrichment]) -> Decimal:
+                            enrichment: Optional[LeadEnrichment],
+                            always_rules: Sequence[ScoringRule],
+                            rules_by_field: Dict[str, Sequence[ScoringRule]]) -> Decimal:
         """Apply custom scoring rules."""
-        for rule in self.custom_rules:
-            if not rule.is_active:
-                continue
-            
-            try:
-                adjustment = self._evaluate_rule(rule, lead, enrichment)
-                score += adjustment * rule.weight
-            except Exception as e:
-                action_logger.warning(f"Failed to apply rule {rule.name}: {e}")
+        # Lowercased field values, filled on first use and shared by all
+        # match rules for this lead
+        lowered: Dict[str, str] = {}
+        
+        for rule in always_rules:
+            score = self._apply_rule(score, rule, lead, enrichment, lowered)
+        
+        # Only walk rules whose field is actually present on this lead
+        if rules_by_field:
+            for field in lead.keys():
+                for rule in rules_by_field.get(field, ()):
+                    score = self._apply_rule(score, rule, lead, enrichment, lowered)
+        
+        return score
+    
+    def _apply_rule(self, score: Decimal, rule: ScoringRule, lead: Dict[str, Any],
+                    enrichment: Optional[LeadEnrichment],
+                    lowered: Dict[str, str]) -> Decimal:
+        """Apply a single custom rule to the running score."""
+        if not rule.is_active:
+            return score
+        
+        try:
+            adjustment = self._evaluate_rule(rule, lead, enrichment, lowered)
+            score += adjustment * rule.weight
+        except Exception as e:
+            action_logger.warning(f"Failed to apply rule {rule.name}: {e}")
         
         return score
     
     def _evaluate_rule(self, rule: ScoringRule, lead: Dict[str, Any],
-                       enrichment: Optional[LeadEnrichment]) -> Decimal:
+                       enrichment: Optional[LeadEnrichment],
+                       lowered: Optional[Dict[str, str]] = None) -> Decimal:
         """Evaluate a single scoring rule."""
         params = rule.parameters
         
@@ -536,13 +708,20 @@ class LeadScoringEngine:
         
         elif rule.rule_type == ScoringRuleType.MATCH:
             field = params.get('field')
-            value = str(lead.get(field, '')).lower()
-            matches = params.get('values', [])
-            return Decimal("0.1") if any(m.lower() in value for m in matches) else Decimal("0.0")
+            if lowered is None:
+                value = str(lead.get(field, '')).lower()
+            else:
+                value = lowered.get(field)
+                if value is None:
+                    value = lowered[field] = str(lead.get(field, '')).lower()
+            matches = self._match_values_lower.get(rule.id)
+            if matches is None:
+                matches = [m.lower() for m in params.get('values', [])]
+            return Decimal("0.1") if any(m in value for m in matches) else Decimal("0.0")
         
         return Decimal("0.0")
     
-    async def override_score(self, request: ScoreOverrideRequest) -> LeadScore:
+    def override_score(self, request: ScoreOverrideRequest) -> LeadScore:
         """
         Manually override a lead's score.
         
@@ -578,25 +757,31 @@ class LeadScoringEngine:
         
         return lead_score
     
-    async def score_batch(self, leads: List[Dict[str, Any]],
-                          enrichments: Dict[UUID, LeadEnrichment] = None) -> List[LeadScore]:
+    def score_batch(self, leads: List[Dict[str, Any]],
+                    enrichments: Dict[UUID, LeadEnrichment] = None) -> List[LeadScore]:
         """
         Score multiple leads.
         
+        Leads are scored serially: scoring is CPU-bound and the action log
+        serializes its writes, so threads would not overlap any work. Weights
+        and rules are snapshotted once, so changes made mid-batch only apply
+        to later batches.
+        
         Args:
             leads: List of lead dictionaries
             enrichments: Optional mapping of lead_id to enrichment
         
         Returns:
-            List of LeadScores
+            List of LeadScores, in the same order as leads
         """
         enrichments = enrichments or {}
-        scores = []
+        now = datetime.now()
+        rules = self._snapshot_rules()
         
+        scores = []
         for lead in leads:
-            lead_id = UUID(lead.get('lead_id', lead.get('id', '')))
-            enrichment = enrichments.get(lead_id)
-            score = await self.score_lead(lead, enrichment)
-            scores.append(score)
-        
+            lead_id = UUID(str(lead.get('lead_id') or lead.get('id')))
+            scores.append(self.score_lead(
+                lead, enrichments.get(lead_id), now=now, lead_id=lead_id, rules=rules
+            ))
         return scores
@@ -1,10 +1,13 @@
 """Google Sheets service for lead data management."""
 
+import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 
 from config.settings import settings
@@ -16,6 +19,40 @@ REQUIRED_COLUMNS = [
     "email", "tag", "status", "follow_up_sent", "last_contacted", "notes"
 ]
 
+# Seconds a fetched copy of the sheet is reused before re-reading it
+CACHE_TTL_SECONDS = 5.0
+
+
+class LeadRows:
+    """Raw sheet rows sharing one header; dicts are only built on demand."""
+    
+    def __init__(self, header: list[str], rows: list[list[Any]]):
+        self.header = header
+        self.rows = rows
+        self._col_index = {name: idx for idx, name in enumerate(header)}
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def __iter__(self) -> Iterator[dict]:
+        for idx in range(len(self.rows)):
+            yield self.record(idx)
+    
+    def record(self, idx: int) -> dict:
+        """Build the dict for one row, padding cells the API trimmed."""
+        row = self.rows[idx]
+        width = len(self.header)
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        return dict(zip(self.header, row))
+    
+    def column(self, name: str) -> list:
+        """Get every value in a column, in row order."""
+        col = self._col_index.get(name)
+        if col is None:
+            return [""] * len(self.rows)
+        return [row[col] if col < len(row) else "" for row in self.rows]
+
 
 class SheetsService:
     """Handles all Google Sheets operations."""
@@ -23,6 +60,13 @@ class SheetsService:
     def __init__(self):
         self._client: Optional[gspread.Client] = None
         self._sheet: Optional[gspread.Worksheet] = None
+        # (fetched_at, records) from the last full-sheet read
+        self._cache: Optional[tuple[float, list[dict]]] = None
+        self._pin_depth = 0
+        self._headers: Optional[list[str]] = None
+        # Lookup indexes rebuilt from each snapshot
+        self._id_to_row: dict[str, int] = {}
+        self._email_set: set[str] = set()
     
     def _connect(self):
         """Establish connection to Google Sheets."""
@@ -41,6 +85,7 @@ class SheetsService:
         self._client = gspread.authorize(creds)
         spreadsheet = self._client.open_by_key(settings.GOOGLE_SHEETS_ID)
         self._sheet = spreadsheet.sheet1
+        self._headers = None
     
     @property
     def sheet(self) -> gspread.Worksheet:
@@ -49,33 +94,84 @@ class SheetsService:
             self._connect()
         return self._sheet
     
-    def get_all_leads(self) -> list[dict]:
-        """Fetch all leads from the sheet."""
-        records = self.sheet.get_all_records()
+    @property
+    def headers(self) -> list[str]:
+        """Get the header row, reading it from the sheet once."""
+        if self._headers is None:
+            self._headers = self.sheet.row_values(1)
+        return self._headers
+    
+    def _cache_is_fresh(self) -> bool:
+        """Check whether the cached snapshot can still be served."""
+        if self._cache is None:
+            return False
+        return bool(self._pin_depth) or time.monotonic() - self._cache[0] < CACHE_TTL_SECONDS
+    
+    def _records(self) -> LeadRows:
+        """Return the cached snapshot, refreshing it and its indexes when stale."""
+        if self._cache_is_fresh():
+            return self._cache[1]
+        
+        values = self.sheet.get_values()
+        records = LeadRows(values[0] if values else [], values[1:])
+        self._cache = (time.monotonic(), records)
+        self._headers = records.header
+        
+        # Data starts on row 2, below the header row
+        self._id_to_row = {
+            str(lead_id): idx + 2
+            for idx, lead_id in enumerate(records.column("lead_id"))
+            if lead_id
+        }
+        self._email_set = {str(email) for email in records.column("email") if email}
         return records
     
+    def get_all_leads(self) -> list[dict]:
+        """Fetch all leads from the sheet, reusing a recent snapshot."""
+        return list(self._records())
+    
+    def invalidate_cache(self):
+        """Drop the cached snapshot so the next read hits the sheet."""
+        self._cache = None
+    
+    @contextmanager
+    def snapshot(self) -> Iterator["SheetsService"]:
+        """Serve every read inside the block from a single sheet fetch."""
+        self._pin_depth += 1
+        try:
+            yield self
+        finally:
+            self._pin_depth -= 1
+    
     def get_leads_by_status(self, status: str) -> list[dict]:
         """Get leads filtered by status."""
-        all_leads = self.get_all_leads()
-        return [lead for lead in all_leads if lead.get("status") == status]
+        leads = self._records()
+        return [
+            leads.record(idx)
+            for idx, value in enumerate(leads.column("status"))
+            if value == status
+        ]
     
     def get_leads_without_tag(self) -> list[dict]:
         """Get leads that haven't been classified yet."""
-        all_leads = self.get_all_leads()
-        return [lead for lead in all_leads if not lead.get("tag")]
+        leads = self._records()
+        return [leads.record(idx) for idx, tag in enumerate(leads.column("tag")) if not tag]
     
     def get_leads_for_followup(self, delay_days: int) -> list[dict]:
         """Get leads eligible for follow-up."""
-        all_leads = self.get_all_leads()
+        leads = self._records()
         eligible = []
         
-        for lead in all_leads:
-            if lead.get("status") != "sent_initial":
+        for idx, (status, follow_up_sent, last_contacted) in enumerate(zip(
+            leads.column("status"),
+            leads.column("follow_up_sent"),
+            leads.column("last_contacted"),
+        )):
+            if status != "sent_initial":
                 continue
-            if str(lead.get("follow_up_sent", "")).lower() == "true":
+            if str(follow_up_sent).lower() == "true":
                 continue
             
-            last_contacted = lead.get("last_contacted")
             if not last_contacted:
                 continue
             
@@ -83,7 +179,7 @@ class SheetsService:
                 contact_date = datetime.fromisoformat(last_contacted)
                 days_since = (datetime.now() - contact_date).days
                 if days_since >= delay_days:
-                    eligible.append(lead)
+                    eligible.append(leads.record(idx))
             except ValueError:
                 continue
         
@@ -91,11 +187,8 @@ class SheetsService:
     
     def find_row_by_lead_id(self, lead_id: str) -> Optional[int]:
         """Find the row number for a lead_id (1-indexed, includes header)."""
-        try:
-            cell = self.sheet.find(lead_id, in_column=1)
-            return cell.row if cell else None
-        except gspread.exceptions.CellNotFound:
-            return None
+        self._records()
+        return self._id_to_row.get(lead_id)
     
     def update_lead(self, lead_id: str, updates: dict) -> bool:
         """Update specific fields for a lead."""
@@ -103,19 +196,22 @@ class SheetsService:
         if not row:
             return False
         
-        headers = self.sheet.row_values(1)
+        headers = self.headers
         
-        for field, value in updates.items():
-            if field in headers:
-                col = headers.index(field) + 1
-                self.sheet.update_cell(row, col, value)
+        # Send every changed cell in a single request
+        batch = [
+            {"range": rowcol_to_a1(row, headers.index(field) + 1), "values": [[value]]}
+            for field, value in updates.items()
+            if field in headers
+        ]
+        if batch:
+            self.sheet.batch_update(batch)
         
+        self.invalidate_cache()
         return True
     
-    def add_lead(self, lead_data: dict) -> str:
-        """Add a new lead to the sheet. Returns the lead_id."""
-        headers = self.sheet.row_values(1)
-        
+    def _build_row(self, lead_data: dict) -> list:
+        """Fill in lead defaults and lay the lead out in sheet column order."""
         # Generate lead_id if not provided
         lead_id = lead_data.get("lead_id") or str(uuid.uuid4())[:8]
         lead_data["lead_id"] = lead_id
@@ -128,28 +224,46 @@ class SheetsService:
         lead_data.setdefault("notes", "")
         
         # Build row in correct column order
-        row = [lead_data.get(col, "") for col in headers]
+        return [lead_data.get(col, "") for col in self.headers]
+    
+    def add_lead(self, lead_data: dict) -> str:
+        """Add a new lead to the sheet. Returns the lead_id."""
+        row = self._build_row(lead_data)
         self.sheet.append_row(row)
+        self.invalidate_cache()
+        
+        return lead_data["lead_id"]
+    
+    def add_leads_bulk(self, leads: list[dict]) -> list[str]:
+        """Add several leads in one append request. Returns their lead_ids."""
+        if not leads:
+            return []
         
-        return lead_id
+        rows = [self._build_row(lead_data) for lead_data in leads]
+        self.sheet.append_rows(rows)
+        self.invalidate_cache()
+        
+        return [lead_data["lead_id"] for lead_data in leads]
     
     def lead_exists(self, email: str) -> bool:
         """Check if a lead with this email already exists."""
-        try:
-            cell = self.sheet.find(email, in_column=6)  # email is column 6
-            return cell is not None
-        except gspread.exceptions.CellNotFound:
-            return False
+        self._records()
+        return email in self._email_set
+    
+    def lead_exists_bulk(self, emails: set[str]) -> set[str]:
+        """Return the subset of emails that already exist in the sheet."""
+        self._records()
+        return emails & self._email_set
     
     def get_emails_sent_today(self) -> int:
         """Count emails sent today for rate limiting."""
         today = datetime.now().strftime("%Y-%m-%d")
-        all_leads = self.get_all_leads()
         
-        count = 0
-        for lead in all_leads:
-            last_contacted = lead.get("last_contacted", "")
-            if last_contacted.startswith(today):
-                count += 1
+        if self._cache_is_fresh() or "last_contacted" not in self.headers:
+            values = [str(value) for value in self._records().column("last_contacted")]
+        else:
+            # Pull only the last_contacted column rather than the whole sheet
+            col = self.headers.index("last_contacted") + 1
+            values = self.sheet.col_values(col)[1:]
         
-        return count
+        return sum(1 for last_contacted in values if last_contacted.startswith(today))
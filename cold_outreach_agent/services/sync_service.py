@@ -1,16 +1,22 @@
 """Sync service for Google Sheets and external integrations."""
 
 import asyncio
+import base64
 import csv
 import io
 import json
 import hashlib
+import hmac
 import secrets
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import (
+    Optional, Dict, Any, List, Iterable, Union, Callable, Tuple, AsyncIterator, NamedTuple
+)
 from uuid import UUID
 import os
+from collections import deque
+from itertools import islice
 
 from ..core.models.sync import (
     SyncConfiguration, SyncJob, SyncConflict, SyncDirection, SyncStatus,
@@ -22,6 +28,52 @@ from ..core.exceptions import ColdOutreachAgentError
 from ..modules.logger import action_logger
 
 
+# Read buffer for CSV sync files. The csv module pulls many small reads from
+# the file; a 1 MiB buffer amortizes them into far fewer read() syscalls on
+# large files while staying small next to the rows being processed.
+CSV_READ_BUFFER_SIZE = 1024 * 1024
+
+# Rows parsed per worker-thread hop while syncing a CSV file
+CSV_SYNC_CHUNK_ROWS = 1000
+
+# Rows rendered per chunk when streaming a CSV export
+CSV_EXPORT_CHUNK_ROWS = 1000
+
+# Row errors kept on a sync job; failed_records keeps counting past this
+MAX_JOB_ROW_ERRORS = 1000
+
+# Delivery history kept per webhook; older records are evicted
+MAX_DELIVERIES_PER_WEBHOOK = 1000
+
+# Longest wait between webhook retry attempts
+WEBHOOK_MAX_BACKOFF_SECONDS = 3600
+
+# API keys are stored as hex SHA-256 digests. hashlib.sha256 is backed by
+# OpenSSL, which already uses SHA extensions where the CPU has them; the
+# algorithm is fixed (not picked per host) so stored hashes stay portable.
+_API_KEY_HASH = hashlib.sha256
+
+# Value transforms available to field mappings
+_FIELD_TRANSFORMS: Dict[str, Callable[[Any], str]] = {
+    'lowercase': lambda value: str(value).lower(),
+    'uppercase': lambda value: str(value).upper(),
+    'title_case': lambda value: str(value).title(),
+}
+
+# Compiled field mappings: (external_field, internal_field, default_value, transform)
+MappingPlan = Tuple[Tuple[str, str, Optional[str], Optional[Callable[[Any], str]]], ...]
+
+
+class _CsvSyncPlan(NamedTuple):
+    """CSV sync settings resolved once per job from its configuration."""
+    file_path: str
+    delimiter: str
+    encoding: str
+    mapping_plan: MappingPlan
+    unique_key_fields: List[str]
+    bidirectional: bool
+
+
 class SyncError(ColdOutreachAgentError):
     """Sync operation failed."""
     pass
@@ -45,10 +97,17 @@ class SyncService:
         
         self._configs: Dict[UUID, SyncConfiguration] = {}
         self._jobs: Dict[UUID, SyncJob] = {}
+        # Jobs newest-first, overall and per config, so listing needs no sort
+        self._jobs_newest_first: deque = deque()
+        self._jobs_by_config: Dict[UUID, deque] = {}
         self._conflicts: Dict[UUID, SyncConflict] = {}
         self._webhooks: Dict[UUID, WebhookConfig] = {}
+        self._webhooks_by_event: Dict[str, List[WebhookConfig]] = {}
         self._api_keys: Dict[UUID, APIKey] = {}
-        self._webhook_deliveries: List[WebhookDelivery] = []
+        self._api_keys_by_hash: Dict[str, APIKey] = {}
+        self._deliveries_by_webhook: Dict[UUID, deque] = {}
+        # Pending background webhook retries (held so they aren't GC'd)
+        self._retry_tasks: set = set()
     
     # ========== Sync Configuration ==========
     
@@ -146,6 +205,8 @@ class SyncService:
         )
         
         self._jobs[job.id] = job
+        self._jobs_newest_first.appendleft(job)
+        self._jobs_by_config.setdefault(job.config_id, deque()).appendleft(job)
         
         # Start sync in background
         asyncio.create_task(self._run_sync_job(job, config))
@@ -183,18 +244,21 @@ class SyncService:
                 
         except Exception as e:
             job.status = SyncStatus.FAILED
+            job.completed_at = datetime.now()
             job.errors.append({
                 "type": "sync_error",
                 "message": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": job.completed_at.isoformat()
             })
             action_logger.error(f"Sync job {job.id} failed: {e}")
         
-        job.completed_at = datetime.now()
-        job.duration_seconds = int((job.completed_at - job.started_at).total_seconds())
+        # One completion timestamp shared by the job and its config
+        completed_at = job.completed_at or datetime.now()
+        job.completed_at = completed_at
+        job.duration_seconds = int((completed_at - job.started_at).total_seconds())
         
         # Update config with last sync info
-        config.last_sync_at = datetime.now()
+        config.last_sync_at = completed_at
         config.last_sync_status = job.status
     
     async def _sync_google_sheets(self, job: SyncJob, config: SyncConfiguration):
@@ -220,50 +284,80 @@ class SyncService:
         job.updated_records = 3
         job.skipped_records = 2
     
+    def _plan_csv_sync(self, config: SyncConfiguration) -> _CsvSyncPlan:
+        """Resolve a CSV sync configuration into the settings the row loop uses."""
+        source_config = config.source_config
+        return _CsvSyncPlan(
+            file_path=source_config.get('file_path'),
+            delimiter=source_config.get('delimiter', ','),
+            encoding=source_config.get('encoding', 'utf-8'),
+            mapping_plan=self._compile_mappings(config.field_mappings),
+            unique_key_fields=config.unique_key_fields,
+            bidirectional=config.direction == SyncDirection.BIDIRECTIONAL
+        )
+    
     async def _sync_csv(self, job: SyncJob, config: SyncConfiguration):
         """Sync from CSV file."""
-        file_path = config.source_config.get('file_path')
-        if not file_path or not os.path.exists(file_path):
-            raise SyncError(f"CSV file not found: {file_path}")
-        
-        delimiter = config.source_config.get('delimiter', ',')
-        encoding = config.source_config.get('encoding', 'utf-8')
-        
-        with open(file_path, 'r', encoding=encoding) as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            rows = list(reader)
+        plan = self._plan_csv_sync(config)
+        if not plan.file_path or not await asyncio.to_thread(os.path.exists, plan.file_path):
+            raise SyncError(f"CSV file not found: {plan.file_path}")
         
-        job.total_records = len(rows)
-        
-        for row in rows:
-            try:
-                # Map fields
-                mapped_data = self._apply_field_mappings(row, config.field_mappings)
-                
-                # Find existing record by unique key
-                existing = await self._find_by_unique_key(mapped_data, config.unique_key_fields)
-                
-                if existing:
-                    # Check for conflicts
-                    if config.direction == SyncDirection.BIDIRECTIONAL:
-                        conflict = self._detect_conflict(existing, mapped_data)
-                        if conflict:
-                            self._conflicts[conflict.id] = conflict
-                            job.conflicts_detected += 1
-                            continue
-                    
-                    # Update existing
-                    await self._update_record(existing, mapped_data)
-                    job.updated_records += 1
-                else:
-                    # Create new
-                    await self._create_record(mapped_data)
-                    job.created_records += 1
-                
-                job.processed_records += 1
+        f = await asyncio.to_thread(
+            open, plan.file_path, 'r', encoding=plan.encoding, newline='',
+            buffering=CSV_READ_BUFFER_SIZE
+        )
+        try:
+            reader = csv.DictReader(f, delimiter=plan.delimiter)
+            
+            # File reads and CSV parsing run in a worker thread one chunk at a
+            # time, so the event loop stays free and progress is visible
+            # between chunks; totals grow as rows are read
+            while True:
+                rows = await asyncio.to_thread(self._read_csv_chunk, reader)
+                if not rows:
+                    break
+                for row in rows:
+                    job.total_records += 1
+                    await self._sync_csv_row(job, plan, row)
+        finally:
+            f.close()
+    
+    @staticmethod
+    def _read_csv_chunk(reader: csv.DictReader) -> List[Dict]:
+        """Read the next chunk of rows from a CSV reader (blocking)."""
+        return list(islice(reader, CSV_SYNC_CHUNK_ROWS))
+    
+    async def _sync_csv_row(self, job: SyncJob, plan: _CsvSyncPlan, row: Dict):
+        """Sync a single CSV row into the system."""
+        try:
+            # Map fields
+            mapped_data = self._apply_field_mappings(row, plan.mapping_plan)
+            
+            # Find existing record by unique key
+            existing = await self._find_by_unique_key(mapped_data, plan.unique_key_fields)
+            
+            if existing:
+                # Check for conflicts
+                if plan.bidirectional:
+                    conflict = self._detect_conflict(existing, mapped_data)
+                    if conflict:
+                        self._conflicts[conflict.id] = conflict
+                        job.conflicts_detected += 1
+                        return
                 
-            except Exception as e:
-                job.failed_records += 1
+                # Update existing
+                await self._update_record(existing, mapped_data)
+                job.updated_records += 1
+            else:
+                # Create new
+                await self._create_record(mapped_data)
+                job.created_records += 1
+            
+            job.processed_records += 1
+            
+        except Exception as e:
+            job.failed_records += 1
+            if len(job.errors) < MAX_JOB_ROW_ERRORS:
                 job.errors.append({
                     "row": job.processed_records + job.failed_records,
                     "error": str(e)
@@ -288,23 +382,27 @@ class SyncService:
         job.created_records = 3
         job.updated_records = 2
     
-    def _apply_field_mappings(self, data: Dict, mappings: List[FieldMapping]) -> Dict:
-        """Apply field mappings to transform data."""
+    @staticmethod
+    def _compile_mappings(mappings: List[FieldMapping]) -> MappingPlan:
+        """Resolve field mappings once into a plan that rows can be mapped with."""
+        return tuple(
+            (mapping.external_field, mapping.internal_field, mapping.default_value,
+             _FIELD_TRANSFORMS.get(mapping.transform) if mapping.transform else None)
+            for mapping in mappings
+        )
+    
+    def _apply_field_mappings(self, data: Dict, plan: MappingPlan) -> Dict:
+        """Apply compiled field mappings to transform data."""
         result = {}
         
-        for mapping in mappings:
-            value = data.get(mapping.external_field, mapping.default_value)
+        for external_field, internal_field, default_value, transform in plan:
+            value = data.get(external_field, default_value)
             
             # Apply transform
-            if value and mapping.transform:
-                if mapping.transform == 'lowercase':
-                    value = str(value).lower()
-                elif mapping.transform == 'uppercase':
-                    value = str(value).upper()
-                elif mapping.transform == 'title_case':
-                    value = str(value).title()
+            if value and transform:
+                value = transform(value)
             
-            result[mapping.internal_field] = value
+            result[internal_field] = value
         
         return result
     
@@ -315,11 +413,11 @@ class SyncService:
     
     def _detect_conflict(self, existing: Dict, new_data: Dict) -> Optional[SyncConflict]:
         """Detect if there's a conflict between existing and new data."""
-        conflicting = []
-        for key, new_val in new_data.items():
-            old_val = existing.get(key)
-            if old_val != new_val and old_val is not None:
-                conflicting.append(key)
+        # Fields absent from existing read as None and never conflict
+        conflicting = [
+            key for key, new_val in new_data.items()
+            if (old_val := existing.get(key)) is not None and old_val != new_val
+        ]
         
         if conflicting:
             return SyncConflict(
@@ -348,14 +446,12 @@ class SyncService:
     
     async def list_sync_jobs(self, config_id: Optional[UUID] = None,
                               limit: int = 50) -> List[SyncJob]:
-        """List sync jobs, optionally filtered by config."""
-        jobs = list(self._jobs.values())
-        
+        """List sync jobs newest first, optionally filtered by config."""
         if config_id:
-            jobs = [j for j in jobs if j.config_id == config_id]
-        
-        jobs.sort(key=lambda j: j.started_at or datetime.min, reverse=True)
-        return jobs[:limit]
+            jobs = self._jobs_by_config.get(config_id, ())
+        else:
+            jobs = self._jobs_newest_first
+        return list(islice(jobs, limit))
     
     # ========== Conflict Resolution ==========
     
@@ -416,56 +512,96 @@ class SyncService:
     
     # ========== CSV Export ==========
     
-    async def export_leads_csv(self, filters: Optional[Dict] = None) -> str:
+    async def export_leads_csv(self, filters: Optional[Dict] = None,
+                               columns: Optional[Dict[str, str]] = None) -> AsyncIterator[str]:
         """
-        Export leads to CSV format.
+        Export leads to CSV format, streamed in chunks.
         
         Args:
             filters: Optional filters
+            columns: CSV header -> lead field to export, in order; every
+                stored field is exported under its own name when omitted
         
-        Returns:
-            CSV string
+        Yields:
+            CSV text, up to CSV_EXPORT_CHUNK_ROWS rows per chunk, the first
+            chunk starting with the header. With columns the header is always
+            yielded; without, nothing is yielded when there are no leads.
         """
-        leads = await self.db.get_all_leads()
-        
-        if not leads:
-            return ""
-        
         output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=leads[0].keys())
-        writer.writeheader()
-        writer.writerows(leads)
-        
-        return output.getvalue()
-    
-    async def import_leads_csv(self, csv_content: str,
+        writer = None
+        if columns:
+            writer = csv.DictWriter(output, fieldnames=list(columns))
+            writer.writeheader()
+        batch: List[Dict] = []
+        
+        async for lead in self._iter_all_leads():
+            if columns:
+                lead = {header: lead.get(field) for header, field in columns.items()}
+            elif writer is None:
+                writer = csv.DictWriter(output, fieldnames=lead.keys())
+                writer.writeheader()
+            
+            batch.append(lead)
+            if len(batch) >= CSV_EXPORT_CHUNK_ROWS:
+                writer.writerows(batch)
+                batch.clear()
+                yield self._drain_buffer(output)
+        
+        if batch:
+            writer.writerows(batch)
+        if output.tell():
+            yield self._drain_buffer(output)
+    
+    async def _iter_all_leads(self) -> AsyncIterator[Dict]:
+        """Iterate all leads, streaming from the database when it supports it."""
+        if hasattr(self.db, 'iter_all_leads'):
+            async for lead in self.db.iter_all_leads(CSV_EXPORT_CHUNK_ROWS):
+                yield lead
+        else:
+            for lead in await self.db.get_all_leads():
+                yield lead
+    
+    @staticmethod
+    def _drain_buffer(output: io.StringIO) -> str:
+        """Return the buffered text and reset the buffer for reuse."""
+        chunk = output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+        return chunk
+    
+    async def import_leads_csv(self, csv_content: Union[str, Iterable[str]],
                                 field_mappings: List[FieldMapping],
                                 unique_key_fields: List[str]) -> Dict[str, int]:
         """
         Import leads from CSV content.
         
         Args:
-            csv_content: CSV string content
+            csv_content: CSV string content, or an iterable of CSV lines
+                (e.g. an open file) to stream without loading it all
             field_mappings: Field mappings to apply
             unique_key_fields: Fields for unique key matching
         
         Returns:
             Dict with import statistics
         """
-        reader = csv.DictReader(io.StringIO(csv_content))
-        rows = list(reader)
+        if isinstance(csv_content, str):
+            csv_content = io.StringIO(csv_content)
+        reader = csv.DictReader(csv_content)
         
         stats = {
-            "total": len(rows),
+            "total": 0,
             "created": 0,
             "updated": 0,
             "skipped": 0,
             "failed": 0
         }
         
-        for row in rows:
+        mapping_plan = self._compile_mappings(field_mappings)
+        
+        for row in reader:
+            stats['total'] += 1
             try:
-                mapped = self._apply_field_mappings(row, field_mappings)
+                mapped = self._apply_field_mappings(row, mapping_plan)
                 
                 if not mapped.get('email'):
                     stats['skipped'] += 1
@@ -496,6 +632,8 @@ class SyncService:
         )
         
         self._webhooks[webhook.id] = webhook
+        for event in dict.fromkeys(webhook.events):
+            self._webhooks_by_event.setdefault(event, []).append(webhook)
         
         action_logger.log_action(
             lead_id=None,
@@ -526,67 +664,126 @@ class SyncService:
         Returns:
             List of delivery attempts
         """
-        deliveries = []
+        subscribers = self._webhooks_by_event.get(event_type)
+        if not subscribers:
+            return []
         
-        for webhook in self._webhooks.values():
-            if not webhook.is_active:
-                continue
-            if event_type not in webhook.events:
-                continue
-            
-            delivery = await self._deliver_webhook(webhook, event_type, event_data)
-            deliveries.append(delivery)
-            self._webhook_deliveries.append(delivery)
+        targets = [webhook for webhook in subscribers if webhook.is_active]
+        if not targets:
+            return []
         
-        return deliveries
-    
-    async def _deliver_webhook(self, webhook: WebhookConfig,
-                                event_type: str,
-                                event_data: Dict) -> WebhookDelivery:
-        """Deliver a webhook payload."""
-        # Build payload
+        # Serialize the payload once and share it across every subscriber
         payload = {
             "event": event_type,
             "timestamp": datetime.now().isoformat(),
             "data": event_data
         }
+        body = json.dumps(payload, separators=(',', ':'))
+        
+        # Fan out to all subscribers concurrently
+        results = await asyncio.gather(
+            *(self._deliver_webhook(webhook, event_type, body) for webhook in targets),
+            return_exceptions=True
+        )
         
+        deliveries = []
+        for webhook, result in zip(targets, results):
+            if isinstance(result, Exception):
+                action_logger.error(f"Webhook {webhook.id} delivery failed: {result}")
+                continue
+            deliveries.append(result)
+        
+        return deliveries
+    
+    async def _deliver_webhook(self, webhook: WebhookConfig,
+                                event_type: str,
+                                body: str,
+                                attempt_number: int = 1) -> WebhookDelivery:
+        """
+        Deliver a pre-serialized webhook payload.
+        
+        Network errors and 5xx responses schedule a background retry with
+        exponential backoff (up to webhook.max_retries), so the caller gets
+        the first attempt's result without waiting on retries.
+        """
         delivery = WebhookDelivery(
             webhook_id=webhook.id,
             event_type=event_type,
             request_url=webhook.url,
             request_headers=webhook.headers,
-            request_body=json.dumps(payload)
+            request_body=body,
+            attempt_number=attempt_number
         )
         
-        # In production: use aiohttp to POST payload
-        # For now, simulate success
         try:
-            # Simulated delivery
-            delivery.response_status = 200
-            delivery.is_success = True
-            delivery.completed_at = datetime.now()
-            delivery.duration_ms = 150
-            
-            webhook.last_triggered_at = datetime.now()
-            webhook.last_success_at = datetime.now()
-            webhook.consecutive_failures = 0
-            
+            await self._attempt_delivery(webhook, delivery)
+            delivery.is_success = 200 <= delivery.response_status < 300
+            if not delivery.is_success:
+                delivery.error_message = f"HTTP {delivery.response_status}"
         except Exception as e:
             delivery.is_success = False
-            delivery.error_message = str(e)
-            delivery.completed_at = datetime.now()
-            
+            delivery.error_message = str(e)[:1000]
+        
+        delivery.completed_at = datetime.now()
+        webhook.last_triggered_at = delivery.completed_at
+        self._record_delivery(delivery)
+        
+        if delivery.is_success:
+            webhook.last_success_at = delivery.completed_at
+            webhook.consecutive_failures = 0
+        else:
             webhook.consecutive_failures += 1
+            retryable = delivery.response_status is None or delivery.response_status >= 500
+            if retryable and attempt_number <= webhook.max_retries:
+                self._schedule_webhook_retry(webhook, event_type, body, attempt_number)
         
         return delivery
     
+    async def _attempt_delivery(self, webhook: WebhookConfig, delivery: WebhookDelivery):
+        """Send one delivery attempt, recording the response on the delivery."""
+        # In production: use aiohttp to POST payload
+        # For now, simulate success
+        delivery.response_status = 200
+        delivery.duration_ms = 150
+    
+    def _schedule_webhook_retry(self, webhook: WebhookConfig, event_type: str,
+                                body: str, attempt_number: int):
+        """Retry a failed delivery in the background after a backoff delay."""
+        task = asyncio.create_task(
+            self._retry_webhook(webhook, event_type, body, attempt_number)
+        )
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+    
+    async def _retry_webhook(self, webhook: WebhookConfig, event_type: str,
+                             body: str, attempt_number: int):
+        """Wait out the backoff for an attempt, then deliver the next one."""
+        delay = min(webhook.retry_delay_seconds * 2 ** (attempt_number - 1),
+                    WEBHOOK_MAX_BACKOFF_SECONDS)
+        await asyncio.sleep(delay)
+        
+        if not webhook.is_active:
+            return
+        
+        await self._deliver_webhook(webhook, event_type, body, attempt_number + 1)
+    
+    def _record_delivery(self, delivery: WebhookDelivery):
+        """Add a delivery to its webhook's bounded history."""
+        history = self._deliveries_by_webhook.get(delivery.webhook_id)
+        if history is None:
+            history = self._deliveries_by_webhook[delivery.webhook_id] = deque(
+                maxlen=MAX_DELIVERIES_PER_WEBHOOK
+            )
+        history.append(delivery)
+    
     async def get_webhook_deliveries(self, webhook_id: UUID,
                                        limit: int = 50) -> List[WebhookDelivery]:
-        """Get delivery history for a webhook."""
-        deliveries = [d for d in self._webhook_deliveries if d.webhook_id == webhook_id]
-        deliveries.sort(key=lambda d: d.triggered_at, reverse=True)
-        return deliveries[:limit]
+        """Get delivery history for a webhook, newest first."""
+        history = self._deliveries_by_webhook.get(webhook_id)
+        if not history:
+            return []
+        # History is kept in insertion order, so newest-first is a reverse walk
+        return list(islice(reversed(history), limit))
     
     # ========== API Keys ==========
     
@@ -602,10 +799,11 @@ class SyncService:
         Returns:
             Tuple of (APIKey, raw_key) - raw_key is only shown once
         """
-        # Generate random key
-        raw_key = f"sk_{secrets.token_urlsafe(32)}"
+        # Generate random key as ASCII bytes, hash it, then decode once
+        key_bytes = b"sk_" + base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b"=")
+        key_hash = self._hash_api_key(key_bytes)
+        raw_key = key_bytes.decode('ascii')
         key_prefix = raw_key[:8]
-        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
         
         # Calculate expiry
         expires_at = None
@@ -623,6 +821,7 @@ class SyncService:
         )
         
         self._api_keys[api_key.id] = api_key
+        self._api_keys_by_hash[key_hash] = api_key
         
         action_logger.log_action(
             lead_id=None,
@@ -638,6 +837,11 @@ class SyncService:
         
         return api_key, raw_key
     
+    @staticmethod
+    def _hash_api_key(key_bytes: bytes) -> str:
+        """Hash raw API key bytes into the form stored on APIKey.key_hash."""
+        return _API_KEY_HASH(key_bytes).hexdigest()
+    
     async def validate_api_key(self, raw_key: str) -> Optional[APIKey]:
         """
         Validate an API key.
@@ -648,20 +852,20 @@ class SyncService:
         Returns:
             APIKey if valid, None otherwise
         """
-        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+        # Hash once per call; the digest drives both the lookup and the check
+        key_hash = self._hash_api_key(raw_key.encode('utf-8'))
         
-        for api_key in self._api_keys.values():
-            if api_key.key_hash == key_hash:
-                if not api_key.is_valid():
-                    return None
-                
-                # Update usage
-                api_key.last_used_at = datetime.now()
-                api_key.total_requests += 1
-                
-                return api_key
+        api_key = self._api_keys_by_hash.get(key_hash)
+        if not api_key or not hmac.compare_digest(api_key.key_hash, key_hash):
+            return None
+        if not api_key.is_valid():
+            return None
         
-        return None
+        # Update usage
+        api_key.last_used_at = datetime.now()
+        api_key.total_requests += 1
+        
+        return api_key
     
     async def revoke_api_key(self, key_id: UUID, revoked_by: str) -> bool:
         """Revoke an API key."""
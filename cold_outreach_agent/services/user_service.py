@@ -2,13 +2,17 @@
 
 import asyncio
 import hashlib
+import heapq
+import hmac
 import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from uuid import UUID, uuid4
 
 from ..core.models.users import (
-    User, UserRole, Permission, ROLE_PERMISSIONS, LeadAssignment,
+    User, UserRole, Permission, role_has_permission, LeadAssignment,
     ApprovalDelegation, UserActivityLog, UserSession, UserCreate,
     UserUpdate, AssignLeadRequest, DelegateApprovalRequest
 )
@@ -16,6 +20,16 @@ from ..core.exceptions import ColdOutreachAgentError
 from ..modules.logger import action_logger
 
 
+# How long a session stays valid after login
+SESSION_TTL = timedelta(hours=24)
+
+# Authorization decisions are cached per (user_id, permission) for this long
+PERMISSION_CACHE_TTL_SECONDS = 60.0
+
+# Most cached authorization decisions kept; least recently used are evicted
+PERMISSION_CACHE_MAX_ENTRIES = 10_000
+
+
 class UserError(ColdOutreachAgentError):
     """User operation failed."""
     pass
@@ -38,9 +52,18 @@ class UserService:
         self.db = db_service
         
         self._users: Dict[str, User] = {}
-        self._sessions: Dict[str, UserSession] = {}
-        self._assignments: List[LeadAssignment] = []
-        self._delegations: List[ApprovalDelegation] = []
+        # Normalized (casefolded) email -> key in self._users
+        self._email_index: Dict[str, str] = {}
+        # Sessions keyed by the SHA-256 digest of their token, never the token itself
+        self._sessions: Dict[bytes, UserSession] = {}
+        # Min-heap of (expires_at, session key) used to sweep abandoned sessions
+        self._session_expiry: List[Tuple[datetime, bytes]] = []
+        # Assignments indexed by lead and by assignee; delegations by delegatee
+        self._assignments_by_lead: Dict[UUID, List[LeadAssignment]] = {}
+        self._assignments_by_user: Dict[str, List[LeadAssignment]] = {}
+        self._delegations_by_delegatee: Dict[str, List[ApprovalDelegation]] = {}
+        # (user_id, permission) -> (allowed, expires_at on the monotonic clock)
+        self._perm_cache: OrderedDict = OrderedDict()
         
         # Initialize default admin if no users exist
         self._ensure_default_admin()
@@ -60,11 +83,18 @@ class UserService:
                 is_email_verified=True
             )
             self._users[str(admin.id)] = admin
+            self._email_index[self._normalize_email(admin.email)] = str(admin.id)
+    
+    @staticmethod
+    def _normalize_email(email: str) -> str:
+        """Normalize an email for case-insensitive lookups."""
+        return email.casefold()
     
     def _hash_password(self, password: str) -> str:
         """Hash a password (placeholder implementation)."""
-        # In production: use bcrypt or argon2
-        return hashlib.sha256(password.encode()).hexdigest()
+        # In production: use a slow, salted KDF such as argon2 (argon2-cffi)
+        # or bcrypt; BLAKE2b only stands in for the in-memory user store
+        return hashlib.blake2b(password.encode('utf-8'), digest_size=32).hexdigest()
     
     async def create_user(self, request: UserCreate, creator_id: str) -> User:
         """
@@ -82,9 +112,8 @@ class UserService:
             raise UserError("Insufficient permissions to create user")
         
         # Check email uniqueness
-        for user in self._users.values():
-            if user.email.lower() == request.email.lower():
-                raise UserError("Email already in use")
+        if self._normalize_email(request.email) in self._email_index:
+            raise UserError("Email already in use")
         
         user_id = str(UUID(int=secrets.token_hex(16))) if not getattr(request, 'id', None) else request.id
         
@@ -98,6 +127,8 @@ class UserService:
         )
         
         self._users[user.id] = user
+        self._email_index[self._normalize_email(user.email)] = user.id
+        self._invalidate_permissions(user.id)
         
         action_logger.log_action(
             lead_id=None,
@@ -130,13 +161,24 @@ class UserService:
         
         if update.name is not None:
             user.name = update.name
+        if update.email is not None:
+            new_key = self._normalize_email(update.email)
+            old_key = self._normalize_email(user.email)
+            if new_key != old_key:
+                if new_key in self._email_index:
+                    raise UserError("Email already in use")
+                self._email_index.pop(old_key, None)
+                user.email = update.email
+                self._email_index[new_key] = user_id
         if update.role is not None:
             # Only existing admins can change roles
             if await self.check_permission(updater_id, Permission.MANAGE_USERS):
                 user.role = update.role
+                self._invalidate_permissions(user_id)
         if update.is_active is not None:
             if await self.check_permission(updater_id, Permission.MANAGE_USERS):
                 user.is_active = update.is_active
+                self._invalidate_permissions(user_id)
         if update.password is not None:
             user.password_hash = self._hash_password(update.password)
         
@@ -155,17 +197,21 @@ class UserService:
         Returns:
             UserSession if successful, None otherwise
         """
-        user = next((u for u in self._users.values() if u.email.lower() == email.lower()), None)
+        self._sweep_expired()
+        
+        user_id = self._email_index.get(self._normalize_email(email))
+        user = self._users.get(user_id) if user_id else None
         
         if not user or not user.is_active:
             return None
         
-        if user.password_hash != self._hash_password(password):
+        if not hmac.compare_digest(user.password_hash, self._hash_password(password)):
             user.failed_login_attempts += 1
             return None
         
         # Successful login
-        user.last_login_at = datetime.now()
+        now = datetime.now()
+        user.last_login_at = now
         user.failed_login_attempts = 0
         
         # Create session
@@ -173,42 +219,77 @@ class UserService:
         session = UserSession(
             token=token,
             user_id=user.id,
-            expires_at=datetime.now() + timedelta(hours=24),
+            expires_at=now + SESSION_TTL,
             ip_address="127.0.0.1",  # Placeholder
             user_agent="Unknown"  # Placeholder
         )
         
-        self._sessions[token] = session
+        key = self._session_key(token)
+        self._sessions[key] = session
+        heapq.heappush(self._session_expiry, (session.expires_at, key))
         
         return session
     
+    @staticmethod
+    def _session_key(token: str) -> bytes:
+        """Key a session token is stored under (its SHA-256 digest)."""
+        return hashlib.sha256(token.encode('utf-8')).digest()
+    
     async def get_session(self, token: str) -> Optional[UserSession]:
         """Get valid session by token."""
-        session = self._sessions.get(token)
+        self._sweep_expired()
+        
+        key = self._session_key(token)
+        session = self._sessions.get(key)
         if not session:
             return None
         
         if not session.is_valid():
-            del self._sessions[token]
+            del self._sessions[key]
             return None
         
         # Extend session
         session.last_active_at = datetime.now()
         return session
     
+    def _sweep_expired(self):
+        """Drop sessions whose expiry has passed, oldest first."""
+        now = datetime.now()
+        expiry = self._session_expiry
+        while expiry and expiry[0][0] <= now:
+            _, key = heapq.heappop(expiry)
+            # Already gone if the session was logged out or found expired
+            self._sessions.pop(key, None)
+    
     async def logout(self, token: str):
         """Invalidate a session."""
-        if token in self._sessions:
-            del self._sessions[token]
+        self._sessions.pop(self._session_key(token), None)
     
     async def check_permission(self, user_id: str, permission: Permission) -> bool:
-        """Check if user has permission."""
+        """Check if user has permission (cached for PERMISSION_CACHE_TTL_SECONDS)."""
+        key = (user_id, permission)
+        now = time.monotonic()
+        
+        cached = self._perm_cache.get(key)
+        if cached and cached[1] > now:
+            self._perm_cache.move_to_end(key)
+            return cached[0]
+        
         user = self._users.get(user_id)
-        if not user or not user.is_active:
-            return False
+        allowed = bool(user and user.is_active and role_has_permission(user.role, permission))
+        
+        self._perm_cache[key] = (allowed, now + PERMISSION_CACHE_TTL_SECONDS)
+        self._perm_cache.move_to_end(key)
+        if len(self._perm_cache) > PERMISSION_CACHE_MAX_ENTRIES:
+            self._perm_cache.popitem(last=False)
         
-        user_permissions = ROLE_PERMISSIONS.get(user.role, set())
-        return permission in user_permissions
+        return allowed
+    
+    def _invalidate_permissions(self, user_id: str):
+        """Drop cached authorization decisions for a user."""
+        stale = [key for key in self._perm_cache if key[0] == user_id]
+        for key in stale:
+            del self._perm_cache[key]
     
     async def assign_lead(self, request: AssignLeadRequest, assigner_id: str) -> LeadAssignment:
         """
@@ -229,7 +310,8 @@ class UserService:
             reason=request.reason
         )
         
-        self._assignments.append(assignment)
+        self._assignments_by_lead.setdefault(request.lead_id, []).append(assignment)
+        self._assignments_by_user.setdefault(request.assigned_to, []).append(assignment)
         
         # In production: update lead record
         
@@ -248,11 +330,11 @@ class UserService:
     
     async def get_lead_assignments(self, lead_id: UUID) -> List[LeadAssignment]:
         """Get assignments for a lead."""
-        return [a for a in self._assignments if a.lead_id == lead_id and a.is_active]
+        return [a for a in self._assignments_by_lead.get(lead_id, ()) if a.is_active]
     
     async def get_user_assignments(self, user_id: str) -> List[LeadAssignment]:
         """Get assignments for a user."""
-        return [a for a in self._assignments if a.assigned_to == user_id and a.is_active]
+        return [a for a in self._assignments_by_user.get(user_id, ()) if a.is_active]
     
     async def delegate_approval(self, request: DelegateApprovalRequest,
                                  delegator_id: str) -> ApprovalDelegation:
@@ -274,7 +356,7 @@ class UserService:
             reason=request.reason
         )
         
-        self._delegations.append(delegation)
+        self._delegations_by_delegatee.setdefault(request.delegatee_id, []).append(delegation)
         
         action_logger.log_action(
             lead_id=None,
@@ -292,17 +374,14 @@ class UserService:
     async def check_approval_authority(self, user_id: str) -> bool:
         """Check if user has approval authority (direct or delegated)."""
         # Check direct permission
-        if await self.check_permission(user_id, Permission.APPROVE_LEADS):
+        if await self.check_permission(user_id, Permission.LEAD_APPROVE):
             return True
         
-        # Check active delegations
+        # Check active delegations whose delegator still holds the permission
         now = datetime.now()
-        active_delegation = next(
-            (d for d in self._delegations 
-             if d.delegatee_id == user_id 
-             and d.is_active(now)
-             and self.check_permission(d.delegator_id, Permission.APPROVE_LEADS)), # Check if delegator has permission
-            None
-        )
+        for delegation in self._delegations_by_delegatee.get(user_id, ()):
+            if (delegation.is_active(now)
+                    and await self.check_permission(delegation.delegator_id, Permission.LEAD_APPROVE)):
+                return True
         
-        return bool(active_delegation)
+        return False
@@ -1,43 +1,111 @@
 """Production system integration tests."""
 
 import asyncio
+import csv
+import inspect
+import io
+import os
+import time
 import pytest
+import pytest_asyncio
 from pathlib import Path
 from uuid import uuid4
 
-from ..config.production_settings import ProductionSettings
+from ..config.production_settings import ProductionSettings, get_settings
 from ..infrastructure.database.service import ProductionDatabaseService
 from ..infrastructure.logging.service import ProductionLoggingService
 from ..infrastructure.email.service import ProductionEmailService
 from ..infrastructure.email.providers import MockEmailProvider
 from ..core.state_machines.lead_state_machine import LeadStateMachine
 from ..core.state_machines.email_state_machine import EmailStateMachine
+from ..services.sync_service import SyncService
 from ..core.models.lead import LeadCreate, LeadState, ReviewStatus, DiscoverySource
 from ..core.models.email import EmailCampaignCreate, EmailState, CampaignType
 from ..core.models.common import EntityType
+from ..core.exceptions import DatabaseError, DuplicateLeadError
 
 
-@pytest.fixture
-async def test_settings():
+# Async tests share one module-wide event loop so the module-scoped fixtures
+# below are built once and reused
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
+# Timing-sensitive tests only run when asked for (RUN_PERF_TESTS=1), so
+# everyday runs and CI don't flake on a busy machine
+perf = pytest.mark.skipif(
+    not os.getenv("RUN_PERF_TESTS"),
+    reason="set RUN_PERF_TESTS=1 to run timing tests"
+)
+
+# Connection tuning for the throwaway test database: WAL so readers never block
+# the writer, waiting out other writers' locks instead of failing, no fsync
+# work, temp data kept in memory and a 16 MiB page cache. Exclusive locking
+# is left out; it would lock out the service's other connections.
+TEST_DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16384",
+)
+
+# Tables emptied between tests in place of rebuilding the schema
+TEST_TABLES = ("state_transitions", "audit_log", "email_campaigns", "leads")
+
+# Campaign fields shared by every test; only the recipient varies
+CAMPAIGN_TEMPLATE = EmailCampaignCreate(
+    lead_id=uuid4(),
+    campaign_type=CampaignType.INITIAL,
+    subject="Test Subject",
+    body_text="Test body",
+    to_email="template@example.com",
+    from_email="test@example.com",
+    from_name="Test Sender"
+)
+
+
+def make_campaign(lead):
+    """Build campaign data addressed to a lead from the validated template."""
+    return CAMPAIGN_TEMPLATE.model_copy(update={
+        "lead_id": lead.id,
+        "to_email": lead.email,
+        "to_name": lead.business_name
+    })
+
+
+@pytest.fixture(scope="session")
+def test_settings():
     """Create test settings."""
     settings = ProductionSettings()
-    settings.database.path = Path(":memory:")  # In-memory database for tests
     settings.logging.log_dir = Path("test_logs")
     settings.logging.log_dir.mkdir(exist_ok=True)
     settings.email.primary_provider = "mock"
     return settings
 
 
-@pytest.fixture
-async def db_service(test_settings):
-    """Create test database service."""
-    db = ProductionDatabaseService(test_settings.database.path)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def db_service(tmp_path_factory):
+    """Create test database service on a file database private to this module."""
+    # A real file, since the service opens a new connection per operation
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    db = ProductionDatabaseService(db_path, pragmas=TEST_DB_PRAGMAS)
     await db.initialize()
     yield db
 
 
-@pytest.fixture
-async def logging_service(test_settings):
+@pytest_asyncio.fixture(loop_scope="module", autouse=True)
+async def clean_database(request):
+    """Empty the shared database's tables after each test that used it."""
+    yield
+    if "db_service" not in request.fixturenames:
+        return
+    db = request.getfixturevalue("db_service")
+    async with db.transaction() as conn:
+        for table in TEST_TABLES:
+            await conn.execute(f"DELETE FROM {table}")
+
+
+@pytest.fixture(scope="session")
+def logging_service(test_settings):
     """Create test logging service."""
     logger = ProductionLoggingService(
         log_dir=test_settings.logging.log_dir,
@@ -46,15 +114,19 @@ async def logging_service(test_settings):
     yield logger
 
 
-@pytest.fixture
-async def email_service(db_service, logging_service):
+@pytest.fixture(scope="module")
+def email_service(db_service, logging_service):
     """Create test email service with mock provider."""
     config = {
         'primary_provider': 'mock',
         'sender_name': 'Test Sender',
         'sender_email': 'test@example.com',
         'max_emails_per_day': 100,
-        'max_emails_per_hour': 50
+        'max_emails_per_hour': 50,
+        # The service refuses to start without a real provider; these
+        # placeholder credentials are never used, as the mock replaces it
+        'smtp_username': 'test',
+        'smtp_password': 'test'
     }
     
     service = ProductionEmailService(
@@ -63,24 +135,27 @@ async def email_service(db_service, logging_service):
         config=config
     )
     
-    # Add mock provider
+    # The mock takes the SMTP slot, so provider selection picks it, and is
+    # also registered as 'mock' for tests that inspect what it sent
     mock_provider = MockEmailProvider({})
-    service.providers['mock'] = mock_provider
-    service.primary_provider = 'mock'
+    service.providers = {'smtp': mock_provider, 'mock': mock_provider}
     
     yield service
 
 
-@pytest.fixture
-async def lead_state_machine(db_service, logging_service):
+@pytest.fixture(scope="module")
+def lead_state_machine(db_service, logging_service):
     """Create test lead state machine."""
     return LeadStateMachine(db_service, logging_service)
 
 
-@pytest.fixture
-async def email_state_machine(db_service, logging_service):
+@pytest.fixture(scope="module")
+def email_state_machine(db_service, logging_service):
     """Create test email state machine."""
-    return EmailStateMachine(db_service, logging_service)
+    machine = EmailStateMachine(db_service, logging_service)
+    # No retry backoff, so a failed email can be retried straight away
+    machine.retry_delays = [0]
+    return machine
 
 
 @pytest.fixture
@@ -100,6 +175,7 @@ def sample_lead_data():
     )
 
 
+@module_loop
 class TestDatabaseService:
     """Test database service functionality."""
     
@@ -150,9 +226,19 @@ class TestDatabaseService:
         assert lead1 is not None
         
         # Try to create duplicate
-        with pytest.raises(Exception):  # Should raise DatabaseError
+        with pytest.raises(DatabaseError):
             await db_service.create_lead(sample_lead_data)
     
+    async def test_bulk_duplicate_lead_prevention(self, db_service, sample_lead_data):
+        """Test bulk creation reports a taken maps_url as a duplicate lead."""
+        await db_service.create_lead(sample_lead_data)
+        
+        # Different business, same maps_url: only the UNIQUE constraint catches it
+        duplicate = sample_lead_data.model_copy(update={"business_name": "Other Restaurant"})
+        with pytest.raises(DuplicateLeadError) as exc_info:
+            await db_service.create_leads_bulk([duplicate])
+        assert exc_info.value.context["business_name"] == "Other Restaurant"
+    
     async def test_email_campaign_operations(self, db_service, sample_lead_data):
         """Test email campaign operations."""
         
@@ -160,16 +246,7 @@ class TestDatabaseService:
         lead = await db_service.create_lead(sample_lead_data)
         
         # Create email campaign
-        campaign_data = EmailCampaignCreate(
-            lead_id=lead.id,
-            campaign_type=CampaignType.INITIAL,
-            subject="Test Subject",
-            body_text="Test body",
-            to_email=lead.email,
-            to_name=lead.business_name,
-            from_email="test@example.com",
-            from_name="Test Sender"
-        )
+        campaign_data = make_campaign(lead)
         
         campaign = await db_service.create_email_campaign(campaign_data)
         assert campaign.id is not None
@@ -182,6 +259,7 @@ class TestDatabaseService:
         assert retrieved_campaign.id == campaign.id
 
 
+@module_loop
 class TestLeadStateMachine:
     """Test lead state machine functionality."""
     
@@ -250,19 +328,9 @@ class TestLeadStateMachine:
         lead = await db_service.create_lead(lead_data)
         
         # Move to pending review
-        await lead_state_machine.transition_state(
+        await lead_state_machine.transition_state_sequence(
             lead_id=lead.id,
-            target_state=LeadState.ANALYZING,
-            actor="test_system"
-        )
-        await lead_state_machine.transition_state(
-            lead_id=lead.id,
-            target_state=LeadState.ANALYZED,
-            actor="test_system"
-        )
-        await lead_state_machine.transition_state(
-            lead_id=lead.id,
-            target_state=LeadState.PENDING_REVIEW,
+            target_states=[LeadState.ANALYZING, LeadState.ANALYZED, LeadState.PENDING_REVIEW],
             actor="test_system"
         )
         
@@ -282,6 +350,7 @@ class TestLeadStateMachine:
         assert "email" in result.error.lower()
 
 
+@module_loop
 class TestEmailStateMachine:
     """Test email state machine functionality."""
     
@@ -291,16 +360,7 @@ class TestEmailStateMachine:
         # Create lead and campaign
         lead = await db_service.create_lead(sample_lead_data)
         
-        campaign_data = EmailCampaignCreate(
-            lead_id=lead.id,
-            campaign_type=CampaignType.INITIAL,
-            subject="Test Subject",
-            body_text="Test body",
-            to_email=lead.email,
-            to_name=lead.business_name,
-            from_email="test@example.com",
-            from_name="Test Sender"
-        )
+        campaign_data = make_campaign(lead)
         
         campaign = await db_service.create_email_campaign(campaign_data)
         assert campaign.email_state == EmailState.QUEUED
@@ -331,16 +391,7 @@ class TestEmailStateMachine:
         # Create lead and campaign
         lead = await db_service.create_lead(sample_lead_data)
         
-        campaign_data = EmailCampaignCreate(
-            lead_id=lead.id,
-            campaign_type=CampaignType.INITIAL,
-            subject="Test Subject",
-            body_text="Test body",
-            to_email=lead.email,
-            to_name=lead.business_name,
-            from_email="test@example.com",
-            from_name="Test Sender"
-        )
+        campaign_data = make_campaign(lead)
         
         campaign = await db_service.create_email_campaign(campaign_data)
         
@@ -360,6 +411,7 @@ class TestEmailStateMachine:
         assert result.data.error_count == 1  # Error count preserved
 
 
+@module_loop
 class TestEmailService:
     """Test email service functionality."""
     
@@ -371,8 +423,7 @@ class TestEmailService:
         
         # Update lead to approved state
         from ..core.models.lead import LeadUpdate
-        await db_service.update_lead(lead.id, {"lifecycle_state": LeadState.APPROVED, "review_status": ReviewStatus.APPROVED})
-        lead = await db_service.get_lead_by_id(lead.id)
+        lead = await db_service.update_lead(lead.id, {"lifecycle_state": LeadState.APPROVED, "review_status": ReviewStatus.APPROVED})
         
         # Create and send campaign
         result = await email_service.create_and_send_campaign(
@@ -392,17 +443,20 @@ class TestEmailService:
     async def test_rate_limiting(self, email_service, db_service, sample_lead_data):
         """Test email rate limiting."""
         
-        # Create multiple leads
-        leads = []
-        for i in range(5):
-            lead_data = sample_lead_data.copy()
-            lead_data.business_name = f"Test Restaurant {i}"
-            lead_data.email = f"test{i}@example.com"
-            lead = await db_service.create_lead(lead_data)
-            
-            # Update to approved state
-            await db_service.update_lead(lead.id, {"lifecycle_state": LeadState.APPROVED, "review_status": ReviewStatus.APPROVED})
-            leads.append(await db_service.get_lead_by_id(lead.id))
+        # Create multiple leads concurrently; model_copy with updates skips
+        # re-validating the fixed fixture data
+        created = await asyncio.gather(*[
+            db_service.create_lead(sample_lead_data.model_copy(update={
+                "business_name": f"Test Restaurant {i}",
+                "email": f"test{i}@example.com",
+                "maps_url": f"https://maps.google.com/test{i}"
+            }))
+            for i in range(5)
+        ])
+        
+        # Update to approved state; update_lead returns the updated leads
+        approved = {"lifecycle_state": LeadState.APPROVED, "review_status": ReviewStatus.APPROVED}
+        leads = await asyncio.gather(*[db_service.update_lead(lead.id, approved) for lead in created])
         
         # Set low rate limit for testing
         email_service.max_emails_per_hour = 2
@@ -427,6 +481,48 @@ class TestEmailService:
         assert rate_limited_count > 0
 
 
+@module_loop
+class TestSyncService:
+    """Test sync service exports against the production database."""
+    
+    async def test_csv_export_streams_all_leads(self, db_service, sample_lead_data):
+        """Test CSV export pages through every lead as an async generator."""
+        await db_service.create_leads_bulk([
+            sample_lead_data.model_copy(update={
+                "business_name": f"Test Restaurant {i}",
+                "maps_url": f"https://maps.google.com/test{i}"
+            })
+            for i in range(5)
+        ])
+        
+        # A batch smaller than the table exercises the keyset paging
+        ids = [lead["id"] async for lead in db_service.iter_all_leads(batch_size=2)]
+        assert len(ids) == len(set(ids)) == 5
+        
+        export = SyncService(db_service).export_leads_csv()
+        assert inspect.isasyncgen(export)
+        
+        content = "".join([chunk async for chunk in export])
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert sorted(row["id"] for row in rows) == sorted(ids)
+    
+    async def test_csv_export_selected_columns(self, db_service, sample_lead_data):
+        """Test CSV export projects leads onto the requested columns."""
+        sync_service = SyncService(db_service)
+        columns = {"lead_id": "id", "outreach_status": "lifecycle_state"}
+        
+        # An empty table still yields the header
+        chunks = [chunk async for chunk in sync_service.export_leads_csv(columns=columns)]
+        assert chunks == ["lead_id,outreach_status\r\n"]
+        
+        lead = await db_service.create_lead(sample_lead_data)
+        content = "".join([chunk async for chunk in sync_service.export_leads_csv(columns=columns)])
+        assert list(csv.DictReader(io.StringIO(content))) == [
+            {"lead_id": str(lead.id), "outreach_status": "discovered"}
+        ]
+
+
+@module_loop
 class TestSystemIntegration:
     """Test full system integration."""
     
@@ -478,9 +574,9 @@ class TestSystemIntegration:
         # Check that all state transitions were logged
         # This would require implementing audit log retrieval
         
-        # 8. Verify final states
+        # 8. Verify final states (step 5 moved the lead on from APPROVED)
         final_lead = await db_service.get_lead_by_id(lead.id)
-        assert final_lead.lifecycle_state == LeadState.APPROVED
+        assert final_lead.lifecycle_state == LeadState.READY_FOR_OUTREACH
         assert final_lead.review_status == ReviewStatus.APPROVED
         
         campaign = result.data
@@ -523,82 +619,91 @@ class TestConfiguration:
     
     def test_settings_validation(self):
         """Test settings validation."""
-        settings = ProductionSettings()
+        settings = get_settings()
         validation_result = settings.validate()
         
         # Should have some validation errors with default settings
         # (missing email credentials, etc.)
         assert isinstance(validation_result, dict)
     
-    def test_environment_override(self):
+    def test_environment_override(self, monkeypatch):
         """Test environment variable override."""
-        import os
-        
-        # Set test environment variable
-        os.environ["MAX_EMAILS_PER_DAY"] = "100"
-        
-        settings = ProductionSettings()
-        assert settings.email.max_emails_per_day == 100
-        
-        # Clean up
-        del os.environ["MAX_EMAILS_PER_DAY"]
+        # Set test environment variable (monkeypatch restores it afterwards)
+        monkeypatch.setenv("MAX_EMAILS_PER_DAY", "100")
+        
+        # Drop the cached settings so the override is read, and again on
+        # exit so later callers don't see it
+        get_settings.cache_clear()
+        try:
+            settings = get_settings()
+            assert settings.email.max_emails_per_day == 100
+        finally:
+            get_settings.cache_clear()
 
 
 # Performance and load tests
+@module_loop
 class TestPerformance:
     """Test system performance under load."""
     
     async def test_concurrent_lead_creation(self, db_service):
         """Test concurrent lead creation."""
         
-        async def create_lead(i):
-            lead_data = LeadCreate(
+        # Build the payloads up front so only the DB calls are gathered
+        payloads = [
+            LeadCreate(
                 business_name=f"Test Business {i}",
                 category="test",
                 location="Test City",
                 discovery_source=DiscoverySource.GOOGLE_MAPS,
                 discovery_confidence=0.8
             )
-            return await db_service.create_lead(lead_data)
+            for i in range(10)
+        ]
         
         # Create leads concurrently
-        tasks = [create_lead(i) for i in range(10)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(db_service.create_lead(payload) for payload in payloads),
+            return_exceptions=True
+        )
         
         # Count successful creations
         successful = [r for r in results if not isinstance(r, Exception)]
         assert len(successful) == 10
     
+    @perf
     async def test_database_performance(self, db_service, sample_lead_data):
         """Test database performance with larger datasets."""
         
-        # Create many leads
-        leads = []
-        for i in range(100):
-            lead_data = sample_lead_data.copy()
-            lead_data.business_name = f"Test Business {i}"
-            lead_data.email = f"test{i}@example.com"
-            lead = await db_service.create_lead(lead_data)
-            leads.append(lead)
-        
-        # Test query performance
-        import time
-        
-        start_time = time.time()
+        # Create many leads in one transaction
+        leads_data = [
+            sample_lead_data.model_copy(update={
+                "business_name": f"Test Business {i}",
+                "email": f"test{i}@example.com",
+                "maps_url": f"https://maps.google.com/test{i}"
+            })
+            for i in range(100)
+        ]
+        leads = await db_service.create_leads_bulk(leads_data)
+        assert len(leads) == 100
+        
+        # Test query performance (monotonic clock, unaffected by NTP jumps)
         from ..core.models.common import PaginationParams
+        from ..core.models.lead import LeadFilter
+        
+        start_ns = time.perf_counter_ns()
         result = await db_service.get_leads(pagination=PaginationParams(page=1, page_size=50))
-        query_time = time.time() - start_time
+        query_ns = time.perf_counter_ns() - start_ns
         
         assert len(result.items) == 50
-        assert query_time < 1.0  # Should complete within 1 second
+        assert query_ns < 1_000_000_000  # Should complete within 1 second
         
         # Test filtering performance
-        start_time = time.time()
-        from ..core.models.lead import LeadFilter
+        start_ns = time.perf_counter_ns()
         filtered_result = await db_service.get_leads(
             filters=LeadFilter(lifecycle_state=LeadState.DISCOVERED),
             pagination=PaginationParams(page=1, page_size=50)
         )
-        filter_time = time.time() - start_time
+        filter_ns = time.perf_counter_ns() - start_ns
         
-        assert filter_time < 1.0  # Should complete within 1 second
\ No newline at end of file
+        assert filter_ns < 1_000_000_000  # Should complete within 1 second
\ No newline at end of file
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """Desktop deployment script for Cold Outreach Agent."""
 
+import importlib.metadata
+import json
+import platform
 import sys
+import time
 from pathlib import Path
 
 # Add project root to path
@@ -10,15 +14,51 @@ sys.path.insert(0, str(project_root))
 
 from cold_outreach_agent.desktop_app.packager import DesktopPackager
 from cold_outreach_agent.core.exceptions import DesktopPackagingError
-from rich.console import Console
-from rich.panel import Panel
 
-console = Console()
+# A passing environment validation is reused for this long, as long as the
+# Python, PyInstaller and platform versions are unchanged
+ENV_CACHE_PATH = Path.home() / ".cache" / "coa" / "deploy_env.json"
+ENV_CACHE_TTL_SECONDS = 600
+
+
+def build_env_fingerprint():
+    """Identify the build toolchain that a validation result applies to."""
+    try:
+        pyinstaller_version = importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
+        pyinstaller_version = None
+    return [sys.version, pyinstaller_version, platform.platform()]
+
+
+def build_env_cached(fingerprint):
+    """Check for a recent passing validation of the same toolchain."""
+    try:
+        if time.time() - ENV_CACHE_PATH.stat().st_mtime > ENV_CACHE_TTL_SECONDS:
+            return False
+        return json.loads(ENV_CACHE_PATH.read_text()).get("fingerprint") == fingerprint
+    except (OSError, ValueError):
+        return False
+
+
+def cache_build_env(fingerprint):
+    """Record a passing validation; failing to write the cache is harmless."""
+    try:
+        ENV_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        ENV_CACHE_PATH.write_text(json.dumps({"fingerprint": fingerprint}))
+    except OSError:
+        pass
 
 
 def main():
     """Main deployment function."""
     
+    # Rich is imported here rather than at module load, and styling is
+    # skipped when output isn't a terminal (--quiet silences it entirely)
+    from rich.console import Console
+    from rich.panel import Panel
+    
+    console = Console(quiet="--quiet" in sys.argv, no_color=not sys.stdout.isatty())
+    
     console.print(Panel.fit(
         "[bold blue]Cold Outreach Agent - Desktop Deployment[/bold blue]\n"
         "[dim]Building production-ready desktop application[/dim]",
@@ -29,11 +69,19 @@ def main():
         # Create packager
         packager = DesktopPackager()
         
-        # Validate build environment
-        console.print("[yellow]Validating build environment...[/yellow]")
-        validation = packager.validate_build_environment()
+        # Validate build environment (skipped when recently validated,
+        # unless --force-validate is passed; the frontend build can change
+        # between runs, so it is re-checked either way)
+        fingerprint = build_env_fingerprint()
+        if "--force-validate" not in sys.argv and build_env_cached(fingerprint):
+            console.print("[green]✓ Build environment cached[/green]")
+            validation = None
+            warnings = packager.check_frontend_build()
+        else:
+            console.print("[yellow]Validating build environment...[/yellow]")
+            validation = packager.validate_build_environment()
         
-        if not validation["valid"]:
+        if validation and not validation["valid"]:
             console.print("[red]Build environment validation failed:[/red]")
             for error in validation["errors"]:
                 console.print(f"  [red]✗[/red] {error}")
@@ -46,7 +94,13 @@ def main():
             console.print("\n[red]Please fix the errors above before building.[/red]")
             return 1
         
-        console.print("[green]✓ Build environment validated[/green]")
+        if validation:
+            cache_build_env(fingerprint)
+            console.print("[green]✓ Build environment validated[/green]")
+            warnings = validation["warnings"]
+        
+        for warning in warnings:
+            console.print(f"  [yellow]⚠[/yellow] {warning}")
         
         # Package application
         console.print("\n[yellow]Building desktop application...[/yellow]")
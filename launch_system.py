@@ -1,13 +1,72 @@
 
+import asyncio
 import os
 import sys
 import subprocess
-import time
 import signal
+import hashlib
 from pathlib import Path
 import shutil
 
-def main():
+import aiohttp
+
+async def start_process_group(*args, cwd):
+    """Start a service directly (no shell) as the leader of its own process group."""
+    if os.name == 'nt':
+        return await asyncio.create_subprocess_exec(
+            *args, cwd=cwd, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    return await asyncio.create_subprocess_exec(*args, cwd=cwd, start_new_session=True)
+
+def stop_process_group(p):
+    """Signal a service's whole process group so its children stop too."""
+    if p.returncode is not None:
+        return
+    if os.name == 'nt':
+        p.send_signal(signal.CTRL_BREAK_EVENT)
+    else:
+        os.killpg(os.getpgid(p.pid), signal.SIGTERM)
+
+# Seconds a single health probe may take, DNS and connect included
+PROBE_TIMEOUT = 5
+
+async def wait_ready(url, timeout=30):
+    """Poll url every 200ms until it answers 200 OK; False if the timeout passes."""
+    async def poll():
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    # Bound each probe too, so one stalled connect cannot eat the budget
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT)) as response:
+                        if response.status == 200:
+                            return True
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    pass
+                await asyncio.sleep(0.2)
+
+    try:
+        return await asyncio.wait_for(poll(), timeout)
+    except asyncio.TimeoutError:
+        return False
+
+def lockfile_digest(frontend_dir):
+    """Hash package-lock.json, or return None when there is no lockfile."""
+    lockfile = frontend_dir / "package-lock.json"
+    if not lockfile.exists():
+        return None
+    return hashlib.blake2b(lockfile.read_bytes()).hexdigest()
+
+async def install_frontend(npm_cmd, frontend_dir, digest):
+    """Install frontend packages and record the lockfile hash they came from."""
+    # npm ci installs exactly what the lockfile pins, skipping dependency resolution
+    args = [npm_cmd, "ci" if digest else "install"]
+    process = await asyncio.create_subprocess_exec(*args, cwd=frontend_dir)
+    if await process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, args)
+    if digest:
+        (frontend_dir / "node_modules" / ".lockfile-hash").write_text(digest)
+
+async def run():
     # Get project root
     project_root = Path(__file__).parent.absolute()
     frontend_dir = project_root / "Frontend"
@@ -16,14 +75,8 @@ def main():
     
     # 1. Resolve npm executable
     # On Windows, we want npm.cmd to avoid PowerShell script execution policy issues with npm.ps1
-    npm_cmd = "npm"
-    if os.name == 'nt':
-        npm_path = shutil.which("npm.cmd")
-        if npm_path:
-            npm_cmd = npm_path
-        else:
-            # Fallback to just npm and hope shell=True handles it via cmd.exe
-            npm_cmd = "npm"
+    # Without a shell the name must resolve to a real file, so look it up on PATH
+    npm_cmd = shutil.which("npm.cmd" if os.name == 'nt' else "npm") or shutil.which("npm") or "npm"
             
     print(f">> Using npm: {npm_cmd}")
 
@@ -32,29 +85,34 @@ def main():
     try:
         # 2. Start Backend
         print("\n[1/2] Starting Backend Server...")
-        backend_process = subprocess.Popen(
-            [sys.executable, "run_production.py", "server"],
-            cwd=project_root,
-            shell=True # Use shell to open in new window if possible? No, keep in same console for log visibility or separate?
-            # actually better to keep them running. To have them pop up separate windows we need 'start' command equivalent or creationflags
+        backend_process = await start_process_group(
+            sys.executable, "run_production.py", "server",
+            cwd=project_root
         )
         processes.append(backend_process)
-        
-        # Give backend a moment
-        time.sleep(2)
 
         # 3. Start Frontend
         print(f"\n[2/2] Starting Frontend in {frontend_dir}...")
         
-        # Install dependencies if missing
-        if not (frontend_dir / "node_modules").exists():
+        # Install dependencies if missing or the lockfile changed since the
+        # last install, overlapping the backend's start-up
+        digest = lockfile_digest(frontend_dir)
+        hash_file = frontend_dir / "node_modules" / ".lockfile-hash"
+        installed = hash_file.read_text() if hash_file.exists() else None
+        install = None
+        if not (frontend_dir / "node_modules").exists() or (digest and digest != installed):
             print("Installing frontend dependencies (this may take a minute)...")
-            subprocess.run([npm_cmd, "install"], cwd=frontend_dir, shell=True, check=True)
+            install = asyncio.create_task(install_frontend(npm_cmd, frontend_dir, digest))
+        
+        # Wait for the backend to answer instead of a fixed sleep
+        if not await wait_ready("http://127.0.0.1:8000/health"):
+            print("!! Backend not responding yet, starting frontend anyway")
+        if install:
+            await install
             
-        frontend_process = subprocess.Popen(
-            [npm_cmd, "run", "dev"],
-            cwd=frontend_dir,
-            shell=True
+        frontend_process = await start_process_group(
+            npm_cmd, "run", "dev",
+            cwd=frontend_dir
         )
         processes.append(frontend_process)
 
@@ -64,10 +122,9 @@ def main():
         print("\nPress Ctrl+C to stop all services.")
         
         # Keep execution alive
-        backend_process.wait()
-        frontend_process.wait()
+        await asyncio.gather(backend_process.wait(), frontend_process.wait())
 
-    except KeyboardInterrupt:
+    except asyncio.CancelledError:
         print("\n-- Stopping services...")
     except Exception as e:
         print(f"\n!! Error: {e}")
@@ -75,14 +132,17 @@ def main():
         # Kill child processes
         for p in processes:
             try:
-                if os.name == 'nt':
-                    # Force kill on windows including tree
-                    subprocess.run(["taskkill", "/F", "/T", "/PID", str(p.pid)], capture_output=True)
-                else:
-                    p.terminate()
+                stop_process_group(p)
             except:
                 pass
-        sys.exit(0)
+
+def main():
+    # One event loop supervises both services; Ctrl+C cancels it
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    sys.exit(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
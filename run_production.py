@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Simple launcher script to run the Cold Outreach Agent production system."""
 
+import runpy
 import sys
 import os
 from pathlib import Path
@@ -31,7 +32,7 @@ except ImportError as e:
     
     # Alternative approach - run the start-production.py script
     try:
-        exec(open(project_root / "start-production.py").read())
+        runpy.run_path(str(project_root / "start-production.py"), run_name="__main__")
     except Exception as e2:
         print(f"Failed to run start-production.py: {e2}")
         print("Available files:")
@@ -5,9 +5,11 @@ Simple API server that works without complex imports.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 import uvicorn
+import asyncio
+import json
 import sys
 from pathlib import Path
 
@@ -20,46 +22,86 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Browser origins allowed to call the API: the dev dashboards and the API itself
+_ORIGINS = (
+    "http://localhost:5173",
+    "http://localhost:8080",
+    "http://localhost:8000",
+    "http://localhost:8001",
+)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["content-type", "authorization"],
 )
 
+# The static endpoints always return the same body, so serialize each once
+def _json_bytes(payload):
+    return json.dumps(payload).encode()
+
+_ROOT_JSON = _json_bytes({
+    "message": "Cold Outreach Agent API",
+    "version": "1.0.0",
+    "status": "running"
+})
+_HEALTH_JSON = _json_bytes({
+    "status": "healthy",
+    "service": "cold_outreach_agent",
+    "version": "1.0.0"
+})
+_LEADS_JSON = _json_bytes({
+    "leads": [],
+    "total": 0,
+    "message": "Lead discovery system is ready. Use the CLI or web interface to discover leads."
+})
+_CAMPAIGNS_JSON = _json_bytes({
+    "campaigns": [],
+    "total": 0,
+    "message": "Email campaign system is ready."
+})
+_STATUS_JSON = _json_bytes({
+    "system": "operational",
+    "components": {
+        "api": "running",
+        "database": "ready",
+        "scraping": "ready",
+        "email": "ready"
+    },
+    "message": "All systems operational. Ready for lead discovery and outreach."
+})
+
+DASHBOARD_PATH = Path(__file__).parent / "web_interface.html"
+_dashboard_html = None  # Read on first request, off the event loop
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Cold Outreach Agent API",
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return Response(_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "cold_outreach_agent",
-        "version": "1.0.0"
-    }
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 @app.get("/dashboard")
 async def dashboard():
     """Serve the web dashboard."""
-    return FileResponse("web_interface.html")
+    global _dashboard_html
+    if _dashboard_html is None:
+        try:
+            _dashboard_html = await asyncio.to_thread(DASHBOARD_PATH.read_bytes)
+        except OSError:
+            raise HTTPException(status_code=404, detail="Dashboard not found")
+    return Response(_dashboard_html, media_type="text/html")
 
 @app.get("/api/leads")
 async def get_leads():
     """Get leads endpoint (placeholder)."""
-    return {
-        "leads": [],
-        "total": 0,
-        "message": "Lead discovery system is ready. Use the CLI or web interface to discover leads."
-    }
+    return Response(_LEADS_JSON, media_type="application/json")
 
 @app.post("/api/leads/discover")
 async def discover_leads(query: str, location: str, max_results: int = 50):
@@ -75,25 +117,12 @@ async def discover_leads(query: str, location: str, max_results: int = 50):
 @app.get("/api/campaigns")
 async def get_campaigns():
     """Get email campaigns endpoint (placeholder)."""
-    return {
-        "campaigns": [],
-        "total": 0,
-        "message": "Email campaign system is ready."
-    }
+    return Response(_CAMPAIGNS_JSON, media_type="application/json")
 
 @app.get("/api/status")
 async def get_system_status():
     """Get system status."""
-    return {
-        "system": "operational",
-        "components": {
-            "api": "running",
-            "database": "ready",
-            "scraping": "ready",
-            "email": "ready"
-        },
-        "message": "All systems operational. Ready for lead discovery and outreach."
-    }
+    return Response(_STATUS_JSON, media_type="application/json")
 
 if __name__ == "__main__":
     print("Starting Simple Cold Outreach Agent API...")
@@ -5,320 +5,435 @@ Launches all services: Backend API, Dashboard, and Frontend
 Non-Docker version with full dependency management
 """
 
+import asyncio
+import importlib.util
+import logging
+import queue
+import shutil
 import subprocess
 import sys
-import time
 import os
 import signal
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-import threading
 import webbrowser
 
+import aiohttp
+
+import _uvicorn_launcher
+
+logger = logging.getLogger("start-all-services")
+
+def setup_logging():
+    """Send launcher output through a queue drained by a background thread.
+    
+    Logging calls only enqueue the record, so a slow terminal never blocks
+    the event loop; the listener thread does the actual writes.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+@dataclass(frozen=True)
+class ServicePaths:
+    """Directories the launcher works with, resolved once."""
+    root: Path
+    backend: Path
+    dashboard: Path
+    frontend: Path
+
+_ROOT = Path(__file__).resolve().parent
+PATHS = ServicePaths(
+    root=_ROOT,
+    backend=_ROOT / "cold_outreach_agent",
+    dashboard=_ROOT / "cold_outreach_agent" / "dashboard",
+    frontend=_ROOT / "Frontend"
+)
+
+# Seconds a single health probe may take, DNS and connect included
+PROBE_TIMEOUT = 5
+
+async def wait_ready(url, timeout=30):
+    """Poll url every 200ms until it answers 200 OK; False if the timeout passes."""
+    async def poll():
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    # Bound each probe too, so one stalled connect cannot eat the budget
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT)) as response:
+                        if response.status == 200:
+                            return True
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    pass
+                await asyncio.sleep(0.2)
+
+    try:
+        return await asyncio.wait_for(poll(), timeout)
+    except asyncio.TimeoutError:
+        return False
+
+# On POSIX each service leads its own process group, so cleanup can signal
+# the service together with everything it spawned (npm -> node, etc.)
+SERVICE_SPAWN_KWARGS = {} if sys.platform == "win32" else {"start_new_session": True}
+
+async def run_command(*args):
+    """Run a command to completion; return its exit code and stripped stdout."""
+    process = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+    )
+    stdout, _ = await process.communicate()
+    return process.returncode, stdout.decode(errors='replace').strip()
+
 class ServiceManager:
-    def __init__(self):
+    def __init__(self, paths=PATHS):
         self.processes = []
-        self.root_dir = Path(__file__).parent
-        self.backend_dir = self.root_dir / "cold_outreach_agent"
-        self.dashboard_dir = self.backend_dir / "dashboard"
-        self.frontend_dir = self.root_dir / "Frontend"
+        self.root_dir = paths.root
+        self.backend_dir = paths.backend
+        self.dashboard_dir = paths.dashboard
+        self.frontend_dir = paths.frontend
         
     def print_banner(self):
         """Print startup banner."""
-        print("🚀 Cold Outreach Agent - Complete System Launcher")
-        print("=" * 60)
-        print("Starting all services without Docker...")
-        print()
+        logger.info("🚀 Cold Outreach Agent - Complete System Launcher")
+        logger.info("=" * 60)
+        logger.info("Starting all services without Docker...")
+        logger.info("")
         
     def check_python_deps(self):
         """Check Python dependencies for backend."""
-        print("🐍 Checking Python dependencies...")
+        logger.info("🐍 Checking Python dependencies...")
         
         requirements_file = self.backend_dir / "requirements.txt"
         if not requirements_file.exists():
-            print("❌ requirements.txt not found")
+            logger.error("❌ requirements.txt not found")
             return False
             
-        try:
-            # Check key dependencies
-            import fastapi
-            import uvicorn
-            import playwright
-            print("✅ Core Python dependencies found")
-            return True
-        except ImportError as e:
-            print(f"❌ Missing Python dependency: {e}")
-            print(f"💡 Run: pip install -r {requirements_file}")
+        # Check key dependencies (locate them without importing)
+        missing = [name for name in ('fastapi', 'uvicorn', 'playwright') if importlib.util.find_spec(name) is None]
+        if missing:
+            logger.error(f"❌ Missing Python dependency: {', '.join(missing)}")
+            logger.info(f"💡 Run: pip install -r {requirements_file}")
             return False
+        logger.info("✅ Core Python dependencies found")
+        return True
     
-    def check_node_deps(self):
+    async def check_node_deps(self):
         """Check Node.js availability."""
-        print("📦 Checking Node.js...")
+        logger.info("📦 Checking Node.js...")
         
-        try:
-            result = subprocess.run(['node', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ Node.js found: {result.stdout.strip()}")
-            else:
-                print("❌ Node.js not found")
-                print("💡 Install from: https://nodejs.org/")
-                return False
-        except FileNotFoundError:
-            print("❌ Node.js not found")
-            print("💡 Install from: https://nodejs.org/")
+        # PATH lookups first, so a missing tool costs no process spawn
+        if not shutil.which('node'):
+            logger.error("❌ Node.js not found")
+            logger.info("💡 Install from: https://nodejs.org/")
+            return False
+        if not shutil.which('npm'):
+            logger.error("❌ npm not found")
             return False
         
+        # Probe both versions concurrently
         try:
-            npm_result = subprocess.run(['npm', '--version'], capture_output=True, text=True)
-            if npm_result.returncode == 0:
-                print(f"✅ npm found: {npm_result.stdout.strip()}")
-                return True
-            else:
-                print("❌ npm not found")
-                return False
+            (node_code, node_version), (npm_code, npm_version) = await asyncio.gather(
+                run_command('node', '--version'),
+                run_command('npm', '--version')
+            )
         except FileNotFoundError:
-            print("❌ npm not found")
+            logger.error("❌ Node.js/npm not found")
+            logger.info("💡 Install from: https://nodejs.org/")
+            return False
+        
+        if node_code != 0:
+            logger.error("❌ Node.js not found")
+            logger.info("💡 Install from: https://nodejs.org/")
+            return False
+        logger.info(f"✅ Node.js found: {node_version}")
+        
+        if npm_code != 0:
+            logger.error("❌ npm not found")
             return False
+        logger.info(f"✅ npm found: {npm_version}")
+        return True
     
-    def install_frontend_deps(self, directory, name):
+    async def install_frontend_deps(self, directory, name):
         """Install frontend dependencies for a given directory."""
-        node_modules = directory / "node_modules"
-        package_json = directory / "package.json"
+        # One directory listing answers both existence checks
+        with os.scandir(directory) as it:
+            entries = {entry.name for entry in it}
         
-        if not package_json.exists():
-            print(f"⚠️  No package.json found in {directory}")
+        if "package.json" not in entries:
+            logger.warning(f"⚠️  No package.json found in {directory}")
             return False
             
-        if not node_modules.exists():
-            print(f"📦 Installing {name} dependencies...")
-            try:
-                subprocess.run(['npm', 'install'], cwd=directory, check=True)
-                print(f"✅ {name} dependencies installed")
+        if "node_modules" not in entries:
+            logger.info(f"📦 Installing {name} dependencies...")
+            process = await asyncio.create_subprocess_exec('npm', 'install', cwd=directory)
+            if await process.wait() == 0:
+                logger.info(f"✅ {name} dependencies installed")
                 return True
-            except subprocess.CalledProcessError:
-                print(f"❌ Failed to install {name} dependencies")
-                return False
+            logger.error(f"❌ Failed to install {name} dependencies")
+            return False
         else:
-            print(f"✅ {name} dependencies already installed")
+            logger.info(f"✅ {name} dependencies already installed")
             return True
     
-    def start_backend(self):
+    async def start_backend(self):
         """Start the FastAPI backend server."""
-        print("🚀 Starting backend API server...")
+        logger.info("🚀 Starting backend API server...")
         
         try:
-            backend_process = subprocess.Popen([
-                sys.executable, '-m', 'uvicorn', 
-                'api.server:app', 
-                '--host', '0.0.0.0',
-                '--port', '8000',
-                '--reload'
-            ], cwd=self.backend_dir)
+            # One worker unless SYSTEM_API_WORKERS opts in; auto-reload only for
+            # development (--dev)
+            cmd = _uvicorn_launcher.build_cmd(
+                'api.server:app', 8000,
+                workers=_uvicorn_launcher.worker_count(),
+                reload='--dev' in sys.argv
+            )
+            
+            backend_process = await asyncio.create_subprocess_exec(
+                *cmd, cwd=self.backend_dir, env=_uvicorn_launcher.child_env(),
+                **SERVICE_SPAWN_KWARGS
+            )
             
             self.processes.append(('Backend API', backend_process))
-            print("✅ Backend API server starting on http://localhost:8000")
+            logger.info("✅ Backend API server starting on http://localhost:8000")
             return True
             
         except Exception as e:
-            print(f"❌ Failed to start backend: {e}")
+            logger.error(f"❌ Failed to start backend: {e}")
             return False
     
-    def start_dashboard(self):
+    async def start_dashboard(self):
         """Start the dashboard frontend."""
-        print("🚀 Starting dashboard...")
+        logger.info("🚀 Starting dashboard...")
         
         if not self.dashboard_dir.exists():
-            print("⚠️  Dashboard directory not found, skipping...")
+            logger.warning("⚠️  Dashboard directory not found, skipping...")
             return True
             
         try:
-            dashboard_process = subprocess.Popen([
-                'npm', 'run', 'dev'
-            ], cwd=self.dashboard_dir)
+            dashboard_process = await asyncio.create_subprocess_exec(
+                'npm', 'run', 'dev', cwd=self.dashboard_dir, **SERVICE_SPAWN_KWARGS
+            )
             
             self.processes.append(('Dashboard', dashboard_process))
-            print("✅ Dashboard starting on http://localhost:5173")
+            logger.info("✅ Dashboard starting on http://localhost:5173")
             return True
             
         except Exception as e:
-            print(f"❌ Failed to start dashboard: {e}")
+            logger.error(f"❌ Failed to start dashboard: {e}")
             return False
     
-    def start_frontend(self):
+    async def start_frontend(self):
         """Start the main frontend application."""
-        print("🚀 Starting main frontend...")
+        logger.info("🚀 Starting main frontend...")
         
         if not self.frontend_dir.exists():
-            print("⚠️  Frontend directory not found, skipping...")
+            logger.warning("⚠️  Frontend directory not found, skipping...")
             return True
             
         try:
             # Check if there's a specific port configuration
-            frontend_process = subprocess.Popen([
-                'npm', 'run', 'dev'
-            ], cwd=self.frontend_dir)
+            frontend_process = await asyncio.create_subprocess_exec(
+                'npm', 'run', 'dev', cwd=self.frontend_dir, **SERVICE_SPAWN_KWARGS
+            )
             
             self.processes.append(('Frontend', frontend_process))
-            print("✅ Frontend starting (check console for port)")
+            logger.info("✅ Frontend starting (check console for port)")
             return True
             
         except Exception as e:
-            print(f"❌ Failed to start frontend: {e}")
+            logger.error(f"❌ Failed to start frontend: {e}")
             return False
     
-    def wait_for_services(self):
+    async def wait_for_services(self):
         """Wait for services to be ready and show status."""
-        print("\n⏳ Waiting for services to initialize...")
-        time.sleep(5)
+        logger.info("\n⏳ Waiting for services to initialize...")
         
-        # Check backend health
-        try:
-            import requests
-            response = requests.get('http://localhost:8000/api/agent/state', timeout=10)
-            if response.status_code == 200:
-                print("✅ Backend API is responding")
-            else:
-                print("⚠️  Backend API responding but may not be fully ready")
-        except Exception:
-            print("⚠️  Backend API not responding yet (this may be normal)")
+        # Check backend health, returning as soon as it answers
+        if await wait_ready('http://localhost:8000/api/health'):
+            logger.info("✅ Backend API is responding")
+        else:
+            logger.warning("⚠️  Backend API not responding yet (this may be normal)")
         
-        print("\n🎉 Cold Outreach Agent System is running!")
-        print("=" * 60)
-        print("📊 Services:")
-        print("   🔧 Backend API:     http://localhost:8000")
-        print("   📖 API Docs:       http://localhost:8000/docs")
+        logger.info("\n🎉 Cold Outreach Agent System is running!")
+        logger.info("=" * 60)
+        logger.info("📊 Services:")
+        logger.info("   🔧 Backend API:     http://localhost:8000")
+        logger.info("   📖 API Docs:       http://localhost:8000/docs")
         
         if self.dashboard_dir.exists():
-            print("   📊 Dashboard:      http://localhost:5173")
+            logger.info("   📊 Dashboard:      http://localhost:5173")
             
         if self.frontend_dir.exists():
-            print("   🌐 Frontend:       Check console output for port")
+            logger.info("   🌐 Frontend:       Check console output for port")
             
-        print("\n💡 Tips:")
-        print("   • Press Ctrl+C to stop all services")
-        print("   • Check individual console outputs for detailed logs")
-        print("   • If a service fails, check the error messages above")
-        print("=" * 60)
+        logger.info("\n💡 Tips:")
+        logger.info("   • Press Ctrl+C to stop all services")
+        logger.info("   • Check individual console outputs for detailed logs")
+        logger.info("   • If a service fails, check the error messages above")
+        logger.info("=" * 60)
     
     def open_browser(self):
-        """Open browser tabs for the services."""
-        def delayed_open():
-            time.sleep(8)  # Wait for services to fully start
+        """Open browser tabs for the services, on event loop timers."""
+        def safe_open(url):
             try:
-                webbrowser.open('http://localhost:8000/docs')
-                if self.dashboard_dir.exists():
-                    time.sleep(1)
-                    webbrowser.open('http://localhost:5173')
+                webbrowser.open(url)
             except Exception:
                 pass  # Browser opening is optional
         
-        thread = threading.Thread(target=delayed_open, daemon=True)
-        thread.start()
+        # Wait for services to fully start
+        loop = asyncio.get_running_loop()
+        loop.call_later(8, safe_open, 'http://localhost:8000/docs')
+        if self.dashboard_dir.exists():
+            loop.call_later(9, safe_open, 'http://localhost:5173')
+    
+    async def monitor_health(self, interval=5):
+        """Probe the backend periodically and report when it stops answering."""
+        healthy = True
+        while True:
+            await asyncio.sleep(interval)
+            ok = await wait_ready('http://localhost:8000/api/health', timeout=interval)
+            if healthy and not ok:
+                logger.warning("\n⚠️  Backend API stopped responding to health checks")
+            elif ok and not healthy:
+                logger.info("\n✅ Backend API is responding again")
+            healthy = ok
+    
+    async def supervise(self):
+        """Wait on every service's exit at once, reacting as soon as one stops."""
+        waiters = {
+            asyncio.create_task(process.wait(), name=name)
+            for name, process in self.processes
+        }
+        health_task = asyncio.create_task(self.monitor_health())
+        
+        try:
+            while waiters:
+                done, waiters = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = task.get_name()
+                    if name == 'Backend API':  # Backend is critical
+                        logger.error(f"\n❌ {name} stopped unexpectedly (exit code {task.result()})")
+                        return
+                    logger.warning(f"\n⚠️  {name} stopped (exit code {task.result()})")
+        finally:
+            health_task.cancel()
+            for task in waiters:
+                task.cancel()
     
-    def cleanup(self):
+    async def cleanup(self):
         """Stop all running processes."""
-        print("\n🛑 Stopping all services...")
+        logger.info("\n🛑 Stopping all services...")
         
-        for name, process in self.processes:
+        running = [(name, process) for name, process in self.processes if process.returncode is None]
+        for name, _ in running:
+            logger.info(f"   Stopping {name}...")
+        
+        if running and sys.platform == "win32":
+            # One taskkill for every service tree
+            pids = [arg for _, process in running for arg in ('/PID', str(process.pid))]
+            subprocess.run(['taskkill', '/F', '/T', *pids],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elif running:
+            self._signal_groups(running, signal.SIGTERM)
             try:
-                print(f"   Stopping {name}...")
-                if sys.platform == "win32":
-                    # On Windows, use taskkill for better process cleanup
-                    subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], 
-                                 capture_output=True)
-                else:
-                    process.terminate()
-                    process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                print(f"   Force killing {name}...")
-                if sys.platform == "win32":
-                    subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], 
-                                 capture_output=True)
-                else:
-                    process.kill()
-            except Exception as e:
-                print(f"   Error stopping {name}: {e}")
+                await asyncio.wait_for(
+                    asyncio.gather(*[process.wait() for _, process in running]), timeout=5
+                )
+            except asyncio.TimeoutError:
+                stuck = [(name, process) for name, process in running if process.returncode is None]
+                for name, _ in stuck:
+                    logger.info(f"   Force killing {name}...")
+                self._signal_groups(stuck, signal.SIGKILL)
+                await asyncio.gather(*[process.wait() for _, process in stuck])
         
-        print("✅ All services stopped")
+        logger.info("✅ All services stopped")
+    
+    def _signal_groups(self, services, sig):
+        """Send a signal to each service's process group."""
+        for name, process in services:
+            try:
+                os.killpg(os.getpgid(process.pid), sig)
+            except ProcessLookupError:
+                pass  # Already gone
+            except Exception as e:
+                logger.error(f"   Error stopping {name}: {e}")
     
-    def run(self):
+    async def run(self):
         """Main execution flow."""
         self.print_banner()
         
         try:
             # Check all dependencies
             if not self.check_python_deps():
-                print("\n❌ Python dependencies check failed")
+                logger.error("\n❌ Python dependencies check failed")
                 sys.exit(1)
             
-            if not self.check_node_deps():
-                print("\n❌ Node.js dependencies check failed")
+            if not await self.check_node_deps():
+                logger.error("\n❌ Node.js dependencies check failed")
                 sys.exit(1)
             
-            # Install frontend dependencies
-            success = True
+            # Install frontend dependencies for both trees concurrently
+            results = await asyncio.gather(*[
+                self.install_frontend_deps(directory, name)
+                for directory, name in ((self.dashboard_dir, "Dashboard"), (self.frontend_dir, "Frontend"))
+                if directory.exists()
+            ])
             
-            if self.dashboard_dir.exists():
-                success &= self.install_frontend_deps(self.dashboard_dir, "Dashboard")
-            
-            if self.frontend_dir.exists():
-                success &= self.install_frontend_deps(self.frontend_dir, "Frontend")
-            
-            if not success:
-                print("\n❌ Frontend dependency installation failed")
+            if not all(results):
+                logger.error("\n❌ Frontend dependency installation failed")
                 sys.exit(1)
             
-            print("\n🚀 Starting all services...")
-            print("-" * 40)
+            logger.info("\n🚀 Starting all services...")
+            logger.info("-" * 40)
             
             # Start services in order
-            if not self.start_backend():
+            if not await self.start_backend():
                 sys.exit(1)
             
-            time.sleep(3)  # Give backend time to start
+            await asyncio.sleep(3)  # Give backend time to start
             
             if self.dashboard_dir.exists():
-                if not self.start_dashboard():
-                    print("⚠️  Dashboard failed to start, continuing...")
+                if not await self.start_dashboard():
+                    logger.warning("⚠️  Dashboard failed to start, continuing...")
             
-            time.sleep(2)
+            await asyncio.sleep(2)
             
             if self.frontend_dir.exists():
-                if not self.start_frontend():
-                    print("⚠️  Frontend failed to start, continuing...")
+                if not await self.start_frontend():
+                    logger.warning("⚠️  Frontend failed to start, continuing...")
             
             # Show status and open browser
-            self.wait_for_services()
+            await self.wait_for_services()
             self.open_browser()
             
-            # Keep running until interrupted
-            try:
-                while True:
-                    time.sleep(1)
-                    # Check if any critical process died
-                    for name, process in self.processes:
-                        if process.poll() is not None:
-                            if name == 'Backend API':  # Backend is critical
-                                print(f"\n❌ {name} stopped unexpectedly")
-                                raise KeyboardInterrupt
-                            else:
-                                print(f"\n⚠️  {name} stopped")
-            
-            except KeyboardInterrupt:
-                pass
+            # Keep running until interrupted or the backend exits
+            await self.supervise()
         
         finally:
-            self.cleanup()
+            await self.cleanup()
 
 def main():
     """Entry point."""
+    listener = setup_logging()
     try:
         manager = ServiceManager()
-        manager.run()
+        asyncio.run(manager.run())
     except KeyboardInterrupt:
-        print("\n👋 Goodbye!")
+        logger.info("\n👋 Goodbye!")
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
+        logger.error(f"\n❌ Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        # Flush whatever is still queued before exiting
+        listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,11 +4,14 @@ Startup script for Cold Outreach Agent Backend Only
 For when Node.js is not available
 """
 
+import importlib.util
 import subprocess
 import sys
 import time
 from pathlib import Path
 
+import _uvicorn_launcher
+
 def start_backend_only():
     print("🚀 Cold Outreach Agent Backend Launcher")
     print("=" * 50)
@@ -20,27 +23,25 @@ def start_backend_only():
         print(f"❌ Project directory not found: {project_root}")
         return
     
-    # Check Python dependencies
-    try:
-        import fastapi
-        import uvicorn
-        print("✅ Python dependencies found")
-    except ImportError as e:
-        print(f"❌ Missing Python dependency: {e}")
+    # Check Python dependencies (locate them without importing)
+    missing = [name for name in ('fastapi', 'uvicorn') if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing Python dependency: {', '.join(missing)}")
         print("Run: pip install -r requirements.txt")
         return
+    print("✅ Python dependencies found")
     
     print("🚀 Starting backend API server...")
     
     try:
-        # Start backend server
-        subprocess.run([
-            sys.executable, '-m', 'uvicorn', 
-            'api.server:app', 
-            '--host', '0.0.0.0',
-            '--port', '8000',
-            '--reload'
-        ], cwd=project_root)
+        # Start backend server (one worker unless SYSTEM_API_WORKERS opts in; --dev for auto-reload)
+        cmd = _uvicorn_launcher.build_cmd(
+            'api.server:app', 8000,
+            workers=_uvicorn_launcher.worker_count(),
+            reload='--dev' in sys.argv
+        )
+        
+        subprocess.run(cmd, cwd=project_root, env=_uvicorn_launcher.child_env())
         
     except KeyboardInterrupt:
         print("\n🛑 Backend stopped")
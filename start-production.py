@@ -22,11 +22,15 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / "cold_outreach_agent"))
 
 from cold_outreach_agent.config.production_settings import settings
+from cold_outreach_agent.core.models.common import PaginationParams
 from cold_outreach_agent.infrastructure.database.service import ProductionDatabaseService
 from cold_outreach_agent.infrastructure.logging.service import ProductionLoggingService
 
 console = Console()
 
+# The database health check reads a single lead
+_HEALTH_PAGINATION = PaginationParams(page=1, page_size=1)
+
 
 class ProductionLauncher:
     """Production launcher with health checks and monitoring."""
@@ -35,19 +39,45 @@ class ProductionLauncher:
         self.db_service: Optional[ProductionDatabaseService] = None
         self.logging_service: Optional[ProductionLoggingService] = None
         self.server_process = None
+        self._server: Optional[uvicorn.Server] = None
         self.is_running = False
+        # Configuration validation result, computed on first use
+        self._validation_summary: Optional[dict] = None
         
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
+        if hasattr(signal, "SIGHUP"):  # POSIX only
+            signal.signal(signal.SIGHUP, self._signal_handler)
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
         console.print(f"\\n[yellow]Received signal {signum}, initiating graceful shutdown...[/yellow]")
         self.is_running = False
+        
+        # Ask the running server to drain; a second signal skips the wait
+        if self._server is not None:
+            if self._server.should_exit:
+                self._server.force_exit = True
+            self._server.should_exit = True
+    
+    def _get_validation_summary(self) -> dict:
+        """Validate the configuration once and reuse the result.
+        
+        Reset _validation_summary to None if settings are reloaded.
+        """
+        if self._validation_summary is None:
+            self._validation_summary = settings.get_validation_summary()
+        return self._validation_summary
     
     async def validate_environment(self) -> bool:
         """Validate environment and configuration."""
+        # Buffer the whole report and write it to the terminal in one go
+        with console:
+            return self._check_environment()
+    
+    def _check_environment(self) -> bool:
+        """Run the environment checks, printing a line per result."""
         
         console.print("[blue]Validating environment...[/blue]")
         
@@ -59,7 +89,7 @@ class ProductionLauncher:
         console.print(f"[green]✓ Python {sys.version.split()[0]}[/green]")
         
         # Validate configuration
-        validation_summary = settings.get_validation_summary()
+        validation_summary = self._get_validation_summary()
         
         if not validation_summary["is_valid"]:
             console.print("[red]✗ Configuration validation failed:[/red]")
@@ -76,16 +106,14 @@ class ProductionLauncher:
             settings.logging.log_dir,
         ]
         
+        # mkdir with exist_ok is a no-op for existing directories, so no exists() probe first
         for directory in required_dirs:
-            if not directory.exists():
-                try:
-                    directory.mkdir(parents=True, exist_ok=True)
-                    console.print(f"[green]✓ Created directory: {directory}[/green]")
-                except Exception as e:
-                    console.print(f"[red]✗ Failed to create directory {directory}: {e}[/red]")
-                    return False
-            else:
-                console.print(f"[green]✓ Directory exists: {directory}[/green]")
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                console.print(f"[red]✗ Failed to create directory {directory}: {e}[/red]")
+                return False
+            console.print(f"[green]✓ Directory ready: {directory}[/green]")
         
         return True
     
@@ -132,41 +160,69 @@ class ProductionLauncher:
                 self.logging_service.log_error(e, component="launcher", operation="initialize_services")
             return False
     
-    async def run_health_checks(self) -> bool:
-        """Run comprehensive health checks."""
-        
-        checks_passed = 0
-        total_checks = 3
-        
-        # Database health check
+    async def _check_database(self) -> bool:
+        """Database health check: read one page of leads."""
         try:
-            from cold_outreach_agent.core.models.common import PaginationParams
-            await self.db_service.get_leads(pagination=PaginationParams(page=1, page_size=1))
-            checks_passed += 1
+            await self.db_service.get_leads(pagination=_HEALTH_PAGINATION)
+            return True
         except Exception as e:
             console.print(f"[red]✗ Database health check failed: {e}[/red]")
-        
-        # Configuration health check
-        validation_summary = settings.get_validation_summary()
-        if validation_summary["is_valid"]:
-            checks_passed += 1
-        else:
-            console.print("[red]✗ Configuration health check failed[/red]")
-        
-        # File system health check
-        try:
-            # Test write permissions
+            return False
+    
+    async def _check_config(self) -> bool:
+        """Configuration health check."""
+        if self._get_validation_summary()["is_valid"]:
+            return True
+        console.print("[red]✗ Configuration health check failed[/red]")
+        return False
+    
+    async def _check_filesystem(self) -> bool:
+        """File system health check: the log directory must be writable."""
+        def probe_log_dir():
+            # access() answers without modifying the directory; only a "no"
+            # is confirmed with a real write, since it can be wrong on network FS
+            if os.access(settings.logging.log_dir, os.W_OK):
+                return
             test_file = settings.logging.log_dir / "health_check.tmp"
             test_file.write_text("health check", encoding='utf-8')
             test_file.unlink()
-            checks_passed += 1
+        
+        try:
+            await asyncio.to_thread(probe_log_dir)
+            return True
         except Exception as e:
             console.print(f"[red]✗ File system health check failed: {e}[/red]")
+            return False
+    
+    async def run_health_checks(self) -> bool:
+        """Run comprehensive health checks, all at once."""
+        
+        results = await asyncio.gather(
+            self._check_database(),
+            self._check_config(),
+            self._check_filesystem(),
+            return_exceptions=True
+        )
+        return all(result is True for result in results)
+    
+    async def _background_health_loop(self):
+        """Re-run the health checks every health_check_interval while serving."""
+        interval = settings.system.health_check_interval
+        if interval <= 0:
+            return
         
-        return checks_passed == total_checks
+        healthy = True
+        while True:
+            await asyncio.sleep(interval)
+            ok = await self.run_health_checks()
+            if healthy and not ok:
+                console.print("[yellow]⚠ Health checks failing[/yellow]")
+            elif ok and not healthy:
+                console.print("[green]✓ Health checks passing again[/green]")
+            healthy = ok
     
-    def start_api_server(self):
-        """Start the FastAPI server."""
+    async def start_api_server(self):
+        """Start the FastAPI server and serve until shutdown."""
         
         try:
             console.print(f"[blue]Starting API server on {settings.system.environment} environment...[/blue]")
@@ -174,15 +230,28 @@ class ProductionLauncher:
             # Import the production server
             from cold_outreach_agent.api.production_server import app
             
+            # Single worker by default: SQLite serializes writers across processes.
+            # Each extra worker is a separate process with its own copy of the app.
+            workers = settings.system.api_workers or 1
+            reload = (
+                workers == 1
+                and settings.system.debug
+                and settings.system.environment == "development"
+            )
+            
             # Configure server settings
             server_config = {
-                "app": app,
+                # uvicorn needs an import string to spawn workers or reload
+                "app": "cold_outreach_agent.api.production_server:app" if workers > 1 or reload else app,
                 "host": "0.0.0.0",
                 "port": 8000,
                 "log_level": settings.logging.level.lower(),
                 "access_log": settings.logging.log_api_requests,
-                "reload": settings.system.debug and settings.system.environment == "development",
-                "workers": 1,  # Single worker for SQLite compatibility
+                "reload": reload,
+                "workers": workers,
+                # loop/http stay "auto" (uvloop/httptools when installed); fail
+                # fast if the app's startup hooks raise instead of serving anyway
+                "lifespan": "on",
             }
             
             # Add SSL configuration for production
@@ -203,7 +272,20 @@ class ProductionLauncher:
                 )
             
             # Start server
-            uvicorn.run(**server_config)
+            if workers > 1 or reload:
+                # uvicorn's supervisor process owns the workers and their signals
+                uvicorn.run(**server_config)
+            else:
+                # Serve on this event loop, so shutdown signals reach the server
+                # and the periodic health checks can run alongside it
+                self._server = uvicorn.Server(uvicorn.Config(**server_config))
+                health_task = asyncio.create_task(self._background_health_loop())
+                try:
+                    await self._server.serve()
+                finally:
+                    health_task.cancel()
+                if not self._server.started:
+                    raise RuntimeError("API server failed to start")
             
         except Exception as e:
             console.print(f"[red]Failed to start API server: {e}[/red]")
@@ -258,7 +340,7 @@ class ProductionLauncher:
             console.print("[green]✓ All systems ready. Starting API server...[/green]")
             console.print("[dim]Press Ctrl+C to stop the server[/dim]")
             
-            self.start_api_server()
+            await self.start_api_server()
             
             return 0
             
@@ -284,4 +366,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
\ No newline at end of file
+    try:
+        import uvloop  # Installed with uvicorn[standard], except on Windows
+    except ImportError:
+        sys.exit(asyncio.run(main()))
+    sys.exit(uvloop.run(main()))
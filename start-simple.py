@@ -4,18 +4,28 @@ Simple startup script for Cold Outreach Agent System
 Minimal dependency checking, just starts the services
 """
 
+import socket
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 class SimpleServiceManager:
+    # Port each service listens on once it is up
+    SERVICE_PORTS = {'Backend API': 8000, 'Dashboard': 5173, 'Frontend': 8080}
+    # uvicorn logs this once the app's startup hooks have run. With --reload
+    # the port opens earlier (the reloader binds it), so the backend waits on this.
+    BACKEND_READY_LINE = "Application startup complete"
+    
     def __init__(self):
         self.processes = []
         self.root_dir = Path(__file__).parent
         self.backend_dir = self.root_dir / "cold_outreach_agent"
         self.dashboard_dir = self.backend_dir / "dashboard"
         self.frontend_dir = self.root_dir / "Frontend"
+        self._backend_started = threading.Event()
         
     def start_backend(self):
         """Start the FastAPI backend server."""
@@ -28,7 +38,13 @@ class SimpleServiceManager:
                 '--host', '0.0.0.0',
                 '--port', '8000',
                 '--reload'
-            ], cwd=self.backend_dir)
+            ], cwd=self.backend_dir,
+                # Read the output to spot the startup line; it is echoed as-is
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, errors='replace', bufsize=1)
+            threading.Thread(
+                target=self._relay_backend_output, args=(backend_process,), daemon=True
+            ).start()
             
             self.processes.append(('Backend API', backend_process))
             print("✅ Backend API server starting on http://localhost:8000")
@@ -80,21 +96,89 @@ class SimpleServiceManager:
             print(f"❌ Failed to start frontend: {e}")
             return False
     
+    def _relay_backend_output(self, process):
+        """Echo the backend's output, flagging the moment its app has started.
+        
+        Keeps reading until the backend exits, so its pipe never fills up.
+        """
+        for line in process.stdout:
+            sys.stdout.write(line)
+            if self.BACKEND_READY_LINE in line:
+                self._backend_started.set()
+    
+    def _port_open(self, port):
+        """One connection attempt to localhost:port, pausing briefly on failure."""
+        try:
+            with socket.create_connection(('localhost', port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.1)
+            return False
+    
+    def _wait_until_ready(self, name, process, timeout):
+        """Wait for a service to come up; False if the process exits or time runs out."""
+        if name == 'Backend API':
+            is_ready = lambda: self._backend_started.wait(0.1)
+        else:
+            is_ready = lambda: self._port_open(self.SERVICE_PORTS[name])
+        
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                return False
+            if is_ready():
+                return True
+        return False
+    
+    def wait_for_services(self, timeout=30):
+        """Wait for all started services at once; False if any of them exited."""
+        print("⏳ Waiting for services to start...")
+        
+        with ThreadPoolExecutor(max_workers=len(self.processes)) as pool:
+            ready = list(pool.map(
+                lambda entry: self._wait_until_ready(*entry, timeout),
+                self.processes
+            ))
+        
+        all_running = True
+        for (name, process), is_ready in zip(self.processes, ready):
+            if is_ready:
+                print(f"✅ {name} is responding")
+            elif process.poll() is not None:
+                print(f"❌ {name} exited with code {process.returncode}")
+                all_running = False
+            else:
+                print(f"⚠️  {name} not responding yet (this may be normal)")
+        return all_running
+    
     def cleanup(self):
         """Stop all running processes."""
         print("\n🛑 Stopping all services...")
         
-        for name, process in self.processes:
-            try:
-                print(f"   Stopping {name}...")
-                if sys.platform == "win32":
-                    subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], 
-                                 capture_output=True)
-                else:
+        running = [(name, process) for name, process in self.processes if process.poll() is None]
+        for name, _ in running:
+            print(f"   Stopping {name}...")
+        
+        if running and sys.platform == "win32":
+            # One taskkill for every service tree
+            pids = [arg for _, process in running for arg in ('/PID', str(process.pid))]
+            subprocess.run(['taskkill', '/F', '/T', *pids], capture_output=True)
+        elif running:
+            # Signal everything first, then wait against one shared deadline
+            for name, process in running:
+                try:
                     process.terminate()
-                    process.wait(timeout=5)
-            except Exception as e:
-                print(f"   Error stopping {name}: {e}")
+                except Exception as e:
+                    print(f"   Error stopping {name}: {e}")
+            
+            deadline = time.monotonic() + 5
+            for name, process in running:
+                try:
+                    process.wait(timeout=max(0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    print(f"   Force killing {name}...")
+                    process.kill()
+                    process.wait()
         
         print("✅ All services stopped")
     
@@ -104,27 +188,26 @@ class SimpleServiceManager:
         print("=" * 50)
         
         try:
-            # Start services
+            # Start all services back to back, then wait for them together
             if not self.start_backend():
                 sys.exit(1)
             
-            time.sleep(3)  # Give backend time to start
-            
             if self.dashboard_dir.exists():
                 self.start_dashboard()
             
-            time.sleep(2)
-            
             if self.frontend_dir.exists():
                 self.start_frontend()
             
-            print("\n🎉 Services are starting!")
+            if not self.wait_for_services():
+                sys.exit(1)
+            
+            print("\n🎉 Services are running!")
             print("📊 Backend API:     http://localhost:8000")
             print("📖 API Docs:       http://localhost:8000/docs")
             if self.dashboard_dir.exists():
                 print("📊 Dashboard:      http://localhost:5173")
             if self.frontend_dir.exists():
-                print("🌐 Frontend:       Check console for port")
+                print("🌐 Frontend:       http://localhost:8080")
             print("\nPress Ctrl+C to stop all services...")
             
             # Keep running until interrupted
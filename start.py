@@ -4,15 +4,24 @@ Startup script for Cold Outreach Agent System
 Launches both backend API server and frontend dashboard
 """
 
+import importlib.util
+import shutil
+import socket
 import subprocess
 import sys
+import threading
 import time
 import os
 from pathlib import Path
 
+import _uvicorn_launcher
+
 class SystemLauncher:
     def __init__(self):
         self.processes = []
+        # Set by a watcher thread as soon as any child process exits
+        self._child_exited = threading.Event()
+        self._exited_name = None
         self.project_root = Path(__file__).parent / "cold_outreach_agent"
         
     def check_dependencies(self):
@@ -24,20 +33,17 @@ class SystemLauncher:
             print(f"❌ Project directory not found: {self.project_root}")
             return False
         
-        # Check Python dependencies
-        try:
-            import fastapi
-            import uvicorn
-            print("✅ Python dependencies found")
-        except ImportError as e:
-            print(f"❌ Missing Python dependency: {e}")
+        # Check Python dependencies (locate them without importing)
+        missing = [name for name in ('fastapi', 'uvicorn') if importlib.util.find_spec(name) is None]
+        if missing:
+            print(f"❌ Missing Python dependency: {', '.join(missing)}")
             print("Run: pip install -r requirements.txt")
             return False
+        print("✅ Python dependencies found")
         
-        # Check if Node.js is available for frontend
+        # Check if Node.js is available for frontend (PATH lookup, no npm start-up)
         try:
-            result = subprocess.run(['npm', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
+            if shutil.which('npm'):
                 print("✅ Node.js/npm found")
             else:
                 print("❌ npm not found")
@@ -73,13 +79,14 @@ class SystemLauncher:
         
         try:
             # Start backend server
-            backend_process = subprocess.Popen([
-                sys.executable, '-m', 'uvicorn', 
-                'api.server:app', 
-                '--host', '0.0.0.0',
-                '--port', '8000',
-                '--reload'
-            ], cwd=self.project_root)
+            backend_process = subprocess.Popen(
+                _uvicorn_launcher.build_cmd('api.server:app', 8000, reload=True),
+                cwd=self.project_root,
+                env=_uvicorn_launcher.child_env(),
+                # Own session (POSIX): terminal signals go to us, not the
+                # reloader, so cleanup() controls the shutdown order
+                start_new_session=True
+            )
             
             self.processes.append(('Backend API', backend_process))
             print("✅ Backend API server started on http://localhost:8000")
@@ -112,17 +119,11 @@ class SystemLauncher:
     def wait_for_services(self):
         """Wait for services to be ready."""
         print("⏳ Waiting for services to start...")
-        time.sleep(3)
         
-        # Check if backend is responding
-        try:
-            import requests
-            response = requests.get('http://localhost:8000/api/agent/state', timeout=5)
-            if response.status_code == 200:
-                print("✅ Backend API is responding")
-            else:
-                print("⚠️  Backend API may not be fully ready")
-        except:
+        # Check if backend is accepting connections
+        if self._wait_for_port('127.0.0.1', 8000, timeout=5):
+            print("✅ Backend API is responding")
+        else:
             print("⚠️  Backend API not responding yet (this is normal)")
         
         print("\n🎉 Cold Outreach Agent System is starting up!")
@@ -131,6 +132,24 @@ class SystemLauncher:
         print("📖 API Docs: http://localhost:8000/docs")
         print("\nPress Ctrl+C to stop all services")
     
+    def _wait_for_port(self, host, port, timeout):
+        """Poll until something accepts TCP connections on host:port."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.1)
+                if sock.connect_ex((host, port)) == 0:
+                    return True
+            time.sleep(0.05)
+        return False
+    
+    def _watch_process(self, name, process):
+        """Block until a child process exits, then wake the main loop."""
+        process.wait()
+        if not self._child_exited.is_set():
+            self._exited_name = name
+            self._child_exited.set()
+    
     def cleanup(self):
         """Stop all running processes."""
         print("\n🛑 Stopping all services...")
@@ -175,15 +194,18 @@ class SystemLauncher:
             # Wait and show status
             self.wait_for_services()
             
-            # Keep running until interrupted
+            # Keep running until interrupted or a child exits
+            for name, process in self.processes:
+                threading.Thread(
+                    target=self._watch_process, args=(name, process), daemon=True
+                ).start()
+            
             try:
-                while True:
-                    time.sleep(1)
-                    # Check if any process died
-                    for name, process in self.processes:
-                        if process.poll() is not None:
-                            print(f"\n❌ {name} stopped unexpectedly")
-                            raise KeyboardInterrupt
+                # Wake up every second: an untimed wait() is not interrupted
+                # by Ctrl+C on Windows
+                while not self._child_exited.wait(1):
+                    pass
+                print(f"\n❌ {self._exited_name} stopped unexpectedly")
             
             except KeyboardInterrupt:
                 pass
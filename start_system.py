@@ -4,13 +4,44 @@ Complete system launcher for Cold Outreach Agent.
 Starts the API server and opens the web dashboard.
 """
 
+import socket
 import subprocess
 import time
+import urllib.request
 import webbrowser
 import sys
 import os
 from pathlib import Path
 
+HEALTH_URL = "http://localhost:8001/health"
+SERVER_LOG = Path(__file__).parent / "logs" / "simple_api.log"
+
+def api_is_healthy():
+    """True if the API answers its health check with 200 OK."""
+    try:
+        with urllib.request.urlopen(HEALTH_URL, timeout=2) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+def open_dashboard():
+    """Open the dashboard in a browser, unless running headless or under CI."""
+    if sys.stdout.isatty() and not os.environ.get("CI"):
+        webbrowser.open("http://localhost:8001/dashboard")
+
+def wait_for_port(host, port, timeout):
+    """Poll until host:port accepts TCP connections, backing off 50ms -> 800ms."""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.8)
+    return False
+
 def main():
     """Main launcher function."""
     
@@ -18,64 +49,56 @@ def main():
     print("=" * 50)
     
     # Check if the API is already running
-    try:
-        import requests
-        response = requests.get("http://localhost:8001/health", timeout=2)
-        if response.status_code == 200:
-            print("✅ API server is already running!")
-            print("🌐 Opening dashboard...")
-            webbrowser.open("http://localhost:8001/dashboard")
-            print("\n🎉 System is ready!")
-            print("📊 API Server:      http://localhost:8001")
-            print("🌐 Web Dashboard:   http://localhost:8001/dashboard")
-            print("📖 API Docs:       http://localhost:8001/docs")
-            return
-    except:
-        pass
+    if api_is_healthy():
+        print("✅ API server is already running!")
+        print("🌐 Opening dashboard...")
+        open_dashboard()
+        print("\n🎉 System is ready!")
+        print("📊 API Server:      http://localhost:8001")
+        print("🌐 Web Dashboard:   http://localhost:8001/dashboard")
+        print("📖 API Docs:       http://localhost:8001/docs")
+        return
     
     print("🚀 Starting API server...")
     
     # Start the API server in background
     try:
-        # Use subprocess.Popen to start in background
-        process = subprocess.Popen(
-            [sys.executable, "simple_api.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0
-        )
+        # Use subprocess.Popen to start in background. Output goes to a log
+        # file: nothing would read a pipe, and a full pipe blocks the server.
+        SERVER_LOG.parent.mkdir(exist_ok=True)
+        with open(SERVER_LOG, "ab") as log_file:
+            process = subprocess.Popen(
+                [sys.executable, "simple_api.py"],
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                # Output goes to the log, so a console window would stay blank
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            )
         
         print("⏳ Waiting for server to start...")
-        time.sleep(3)
         
-        # Check if server is running
-        max_attempts = 10
-        for attempt in range(max_attempts):
-            try:
-                import requests
-                response = requests.get("http://localhost:8001/health", timeout=2)
-                if response.status_code == 200:
-                    print("✅ API server is running!")
-                    break
-            except:
-                if attempt < max_attempts - 1:
-                    print(f"⏳ Attempt {attempt + 1}/{max_attempts} - waiting...")
-                    time.sleep(2)
-                else:
-                    print("❌ Server failed to start properly")
-                    return
+        # Wait for the port to open, then confirm with a single health request
+        if not (wait_for_port("localhost", 8001, timeout=20) and api_is_healthy()):
+            print("❌ Server failed to start properly")
+            print(f"🔧 See the server log: {SERVER_LOG}")
+            return
+        print("✅ API server is running!")
         
         # Open the dashboard
         print("🌐 Opening web dashboard...")
-        webbrowser.open("http://localhost:8001/dashboard")
+        open_dashboard()
         
         print("\n🎉 System is ready!")
         print("📊 API Server:      http://localhost:8001")
         print("🌐 Web Dashboard:   http://localhost:8001/dashboard")
         print("📖 API Docs:       http://localhost:8001/docs")
-        print("\n💡 The API server is running in a separate window.")
-        print("💡 Close that window to stop the server.")
-        print("💡 Or use Ctrl+C in the server window.")
+        print(f"📄 Server Log:     {SERVER_LOG}")
+        print(f"\n💡 The API server is running in the background (PID {process.pid}).")
+        print("💡 Its output goes to the server log above.")
+        if os.name == 'nt':
+            print(f"💡 Stop it with: taskkill /PID {process.pid} /F")
+        else:
+            print(f"💡 Stop it with: kill {process.pid}")
         
     except Exception as e:
         print(f"❌ Failed to start server: {e}")
@@ -54,7 +54,7 @@ async def main():
     
     # 4. Test Scoring
     print("Running Scoring Engine...")
-    score = await scoring_service.score_lead(lead.dict(), enrichment=None)
+    score = await asyncio.to_thread(scoring_service.score_lead, lead.dict(), None)
     print(f"Lead Scored: {score.composite_score} ({score.composite_level})")
 
     assert score.intent_score.score >= 0, "Intent score should be calculated"